@@ -1,15 +1,30 @@
 from __future__ import annotations
 
+import asyncio
+import gzip
+import hashlib
+import heapq
 import json
+import logging
 import os
 import re
+import stat as stat_module
 import subprocess
+import sys
 import tempfile
 import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from functools import lru_cache, wraps
 from pathlib import Path
+from threading import Lock, Thread
+from typing import IO, TypeVar
+from weakref import WeakKeyDictionary
 
-from fastapi import FastAPI, HTTPException, Request
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.api.schemas import (
@@ -40,69 +55,130 @@ from src.api.schemas import (
     OntologyNormalizeResponse,
 )
 from src.hypergraph.hyperedges import Hyperedge
-from src.kernel.certgen import CertificateVerifyResult, verify_certificate, write_certificate
-from src.kernel.conflicts import ConflictWarning, detect_conflicts
+from src.kernel.certgen import CertificateVerifyResult, verify_certificate, write_certificate_from_payloads
+from src.kernel.conflicts import ConflictWarning, detect_conflicts, parse_verdict
+from src.kernel.constraints import FactExclusionGroup, IncompatibilityPair, InfeasibilityEntry
 from src.kernel.store import (
     SESSION_MANAGER,
     InMemoryKernelArtifactStore,
     KernelArtifactBundle,
     KernelArtifactManifest,
+    KernelDraftProposals,
+    KernelVerificationStatus,
     RuleProvenance,
 )
 from src.ontology.normalize import OntologyInput, normalize_ontology_input
 from src.ontology.registry import build_token_registry
 
-_registry_cache: dict[str, object] | None = None
+logger = logging.getLogger(__name__)
+
+# The registry is static module data, so it and the lookup tables derived
+# from it are built once at import and read as plain module globals.
+_REGISTRY: dict[str, object] = build_token_registry()
+# Tokens are interned, as are stored rule and constraint tokens, so matches
+# against them compare by identity.
+_ACTIONS: frozenset[str] = frozenset(map(sys.intern, _REGISTRY["actions"]))
+_FACTS: frozenset[str] = frozenset(map(sys.intern, _REGISTRY["facts"]))
+_VALID_OUTCOMES: frozenset[str] = frozenset(
+    sys.intern(f"{v}({a})") for v in _REGISTRY["verdicts"] for a in _REGISTRY["actions"]
+)
 
+_registry_payload: dict[str, tuple[bytes, str]] | None = None
 
-def _get_registry() -> dict[str, object]:
-    global _registry_cache  # noqa: PLW0603
-    if _registry_cache is None:
-        _registry_cache = build_token_registry()
-    return _registry_cache
 
+def _get_registry_payload() -> dict[str, tuple[bytes, str]]:
+    """Return the registry pre-serialized as JSON bytes, keyed by content coding.
 
-def _validate_action_token(action: str) -> None:
-    reg = _get_registry()
-    if action not in reg["actions"]:
-        raise HTTPException(
-            status_code=422,
-            detail=f"Invalid action token: '{action}'. Valid actions: {reg['actions']}",
-        )
+    Each entry carries its own ETag, since strong validators must differ
+    between the identity and gzip representations.
+    """
+    global _registry_payload  # noqa: PLW0603
+    if _registry_payload is None:
+        body = json.dumps(_REGISTRY, separators=(",", ":")).encode("utf-8")
+        digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+        _registry_payload = {
+            "identity": (body, f'"{digest}"'),
+            "gzip": (gzip.compress(body, compresslevel=9, mtime=0), f'"{digest}-gz"'),
+        }
+    return _registry_payload
+
+
+@lru_cache(maxsize=64)
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """True if an Accept-Encoding value allows gzip, honouring q-values.
+
+    An explicit gzip (or x-gzip) entry wins over "*"; q=0 means "not
+    acceptable", so "gzip;q=0" and "identity, gzip;q=0" get identity.
+    """
+    gzip_q: float | None = None
+    star_q: float | None = None
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if coding not in ("gzip", "x-gzip", "*"):
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding == "*":
+            star_q = q
+        else:
+            gzip_q = q
+    if gzip_q is not None:
+        return gzip_q > 0
+    return star_q is not None and star_q > 0
 
 
-def _validate_fact_tokens(facts: list[str]) -> None:
-    reg = _get_registry()
-    allowed = set(reg["facts"])
-    invalid = [f for f in facts if f not in allowed]
-    if invalid:
+def _validate_action_token(action: str) -> None:
+    if action not in _ACTIONS:
         raise HTTPException(
             status_code=422,
-            detail=f"Invalid fact tokens: {invalid}",
+            detail=f"Invalid action token: '{action}'. Valid actions: {_REGISTRY['actions']}",
         )
 
 
-_valid_outcomes_cache: set[str] | None = None
-
-
-def _get_valid_outcomes() -> set[str]:
-    global _valid_outcomes_cache  # noqa: PLW0603
-    if _valid_outcomes_cache is None:
-        reg = _get_registry()
-        _valid_outcomes_cache = {
-            f"{v}({a})" for v in reg["verdicts"] for a in reg["actions"]
-        }
-    return _valid_outcomes_cache
+def _validate_fact_tokens(facts: list[str]) -> None:
+    if _FACTS.issuperset(facts):
+        return
+    invalid = [f for f in facts if f not in _FACTS]
+    raise HTTPException(
+        status_code=422,
+        detail=f"Invalid fact tokens: {invalid}",
+    )
 
 
 def _validate_outcome_token(outcome: str) -> None:
-    if outcome not in _get_valid_outcomes():
+    if outcome not in _VALID_OUTCOMES:
         raise HTTPException(
             status_code=422,
             detail=f"Invalid outcome: '{outcome}'. Expected format: Verdict(Action).",
         )
 
 
+def _log_warmup_failure(warmup: asyncio.Future[object]) -> None:
+    if not warmup.cancelled() and (exc := warmup.exception()) is not None:
+        logger.error("Startup warmup failed", exc_info=exc)
+
+
+@asynccontextmanager
+async def _lifespan(app_: FastAPI) -> AsyncIterator[None]:
+    # Encode the registry payload and build the OpenAPI schema on worker threads
+    # so the first request does not pay for them. app.openapi() caches its result.
+    # Failures are logged when they happen; the request path retries lazily.
+    loop = asyncio.get_running_loop()
+    warmup = asyncio.gather(
+        loop.run_in_executor(None, _get_registry_payload),
+        loop.run_in_executor(None, app_.openapi),
+    )
+    warmup.add_done_callback(_log_warmup_failure)
+    yield
+
+
 app = FastAPI(
     title="Verified Protocol Hypergraph API",
     description=(
@@ -112,10 +188,12 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/api/docs",
     openapi_url="/api/openapi.json",
+    lifespan=_lifespan,
 )
 
 cors_origins_env = os.getenv("CORS_ORIGINS", "*")
-allowed_origins = [origin.strip() for origin in cors_origins_env.split(",") if origin.strip()]
+# A frozenset makes Starlette's per-request origin check a hash lookup.
+allowed_origins = frozenset(origin.strip() for origin in cors_origins_env.split(",") if origin.strip())
 if not allowed_origins:
     raise RuntimeError("CORS_ORIGINS is set but does not contain any valid origins.")
 
@@ -123,7 +201,7 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
     allow_credentials=False,
-    allow_methods=["*"],
+    allow_methods=("GET", "POST", "PUT", "DELETE", "OPTIONS"),
     allow_headers=["*"],
 )
 
@@ -143,19 +221,26 @@ def _get_session_store(request: Request) -> InMemoryKernelArtifactStore:
     return SESSION_MANAGER.get_or_create(_get_session_id(request))
 
 
+_ARTIFACT_BASE_DIR = Path(os.getenv("KERNEL_ARTIFACT_DIR", "/tmp/verified-protocol-hypergraph-artifacts"))
+
+
 def _get_session_artifact_dir(request: Request) -> Path:
-    session_id = _get_session_id(request)
-    base = os.getenv("KERNEL_ARTIFACT_DIR", "/tmp/verified-protocol-hypergraph-artifacts")
-    return Path(base) / session_id
+    return _ARTIFACT_BASE_DIR / _get_session_id(request)
 
 
 # ---------------------------------------------------------------------------
 # Response helpers
+#
+# Responses below are built from store state that was validated on the way
+# in, so they use model_construct() to skip re-validation. Request models
+# must keep using the validating constructors. Converters over frozen
+# dataclasses are memoized; their results are shared and must not be mutated.
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=256)
 def _manifest_to_response(manifest: KernelArtifactManifest) -> KernelArtifactManifestResponse:
-    return KernelArtifactManifestResponse(
+    return KernelArtifactManifestResponse.model_construct(
         artifactSource=manifest.artifact_source,
         rulesetVersion=manifest.ruleset_version,
         revision=manifest.revision,
@@ -165,37 +250,82 @@ def _manifest_to_response(manifest: KernelArtifactManifest) -> KernelArtifactMan
     )
 
 
-def _rule_to_response(
-    edge: Hyperedge,
-    provenance: dict[str, RuleProvenance],
-    fallback_by: str,
-    fallback_at: datetime,
-) -> KernelRuleResponse:
-    prov = provenance.get(edge.edge_id)
-    return KernelRuleResponse(
+@lru_cache(maxsize=4096)
+def _rule_to_response(edge: Hyperedge, created_by: str, created_at: str) -> KernelRuleResponse:
+    return KernelRuleResponse.model_construct(
         ruleId=edge.edge_id,
-        premises=sorted(edge.premises),
+        premises=list(edge.sorted_premises),
         outcome=edge.expected_outcome,
         note=edge.note,
-        createdBy=prov.created_by if prov else fallback_by,
-        createdAt=prov.created_at.isoformat() if prov else fallback_at.isoformat(),
+        createdBy=created_by,
+        createdAt=created_at,
     )
 
 
+def _rules_to_response(
+    edges: tuple[Hyperedge, ...],
+    provenance: dict[str, RuleProvenance],
+    fallback_by: str,
+    fallback_at: datetime,
+) -> list[KernelRuleResponse]:
+    get_provenance = provenance.get
+    fallback_at_iso = fallback_at.isoformat()
+    result: list[KernelRuleResponse] = []
+    for edge in edges:
+        prov = get_provenance(edge.edge_id)
+        if prov is None:
+            result.append(_rule_to_response(edge, fallback_by, fallback_at_iso))
+        else:
+            result.append(_rule_to_response(edge, prov.created_by, prov.created_at_iso))
+    return result
+
+
+_VERIFY_CMD = os.getenv("COHERE_VERIFY_CMD", "cohere-verify").strip()
+_KERNEL_DOMAIN = os.getenv("KERNEL_DOMAIN", "obstetrics").strip() or "obstetrics"
+
+
+_VERIFIER_OUTPUT_CHARS = 50_000
+# Keep enough raw bytes for the character tail even if every char is 4 bytes.
+_VERIFIER_OUTPUT_BYTES = 4 * _VERIFIER_OUTPUT_CHARS
+
+
+# How long a timed-out verify waits for its reader threads to reach EOF.
+_READER_JOIN_GRACE_SECONDS = 1.0
+
+
+def _drain_tail(stream: IO[bytes], tail: bytearray) -> None:
+    """Read a pipe to EOF, keeping only its last _VERIFIER_OUTPUT_BYTES bytes."""
+    fd = stream.fileno()
+    with stream:
+        while chunk := os.read(fd, 65536):
+            tail += chunk
+            if len(tail) > 2 * _VERIFIER_OUTPUT_BYTES:
+                del tail[:-_VERIFIER_OUTPUT_BYTES]
+    del tail[:-_VERIFIER_OUTPUT_BYTES]
+
+
+def _decode_tail(tail: bytearray, max_chars: int) -> str:
+    text = tail.decode("utf-8", errors="replace")
+    # Match the universal-newline translation of text-mode pipes.
+    return text.replace("\r\n", "\n").replace("\r", "\n")[-max_chars:]
+
+
 def _run_verifier(file_args: list[str], timeout_seconds: float) -> CohereVerifyResponse:
-    """Invoke the cohere-verify CLI and return a structured result."""
-    verify_cmd = os.getenv("COHERE_VERIFY_CMD", "cohere-verify").strip()
+    """Invoke the cohere-verify CLI and return a structured result.
+
+    Output is drained on reader threads that keep only a bounded tail, so a
+    chatty verifier cannot make us buffer and decode its whole log.
+    """
+    verify_cmd = _VERIFY_CMD
     if not verify_cmd:
         raise HTTPException(status_code=500, detail="COHERE_VERIFY_CMD is set but empty.")
 
     started = time.perf_counter()
     try:
-        proc = subprocess.run(
+        proc = subprocess.Popen(
             [verify_cmd, *file_args],
-            capture_output=True,
-            text=True,
-            timeout=timeout_seconds,
-            check=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
         )
     except FileNotFoundError as exc:
         raise HTTPException(
@@ -205,83 +335,153 @@ def _run_verifier(file_args: list[str], timeout_seconds: float) -> CohereVerifyR
                 "Ensure it is installed in the container/image, or set COHERE_VERIFY_CMD."
             ),
         ) from exc
+
+    stdout_tail = bytearray()
+    stderr_tail = bytearray()
+    readers = [
+        Thread(target=_drain_tail, args=(proc.stdout, stdout_tail), daemon=True),
+        Thread(target=_drain_tail, args=(proc.stderr, stderr_tail), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+
+    try:
+        returncode = proc.wait(timeout=timeout_seconds)
     except subprocess.TimeoutExpired as exc:
+        proc.kill()
+        proc.wait()
+        # A grandchild may still hold the pipes open; don't wait on it.
+        deadline = time.monotonic() + _READER_JOIN_GRACE_SECONDS
+        for reader in readers:
+            reader.join(max(0.0, deadline - time.monotonic()))
         duration_ms = int((time.perf_counter() - started) * 1000)
-        stdout = (exc.stdout or "") if isinstance(exc.stdout, str) else ""
-        stderr = (exc.stderr or "") if isinstance(exc.stderr, str) else ""
         raise HTTPException(
             status_code=504,
             detail={
                 "message": "Verification timed out.",
                 "durationMs": duration_ms,
-                "stdout": stdout[-10_000:],
-                "stderr": stderr[-10_000:],
+                "stdout": _decode_tail(stdout_tail, 10_000),
+                "stderr": _decode_tail(stderr_tail, 10_000),
             },
         ) from exc
 
+    for reader in readers:
+        reader.join()
     duration_ms = int((time.perf_counter() - started) * 1000)
-    return CohereVerifyResponse(
-        ok=proc.returncode == 0,
-        exitCode=proc.returncode,
+    return CohereVerifyResponse.model_construct(
+        ok=returncode == 0,
+        exitCode=returncode,
         durationMs=duration_ms,
-        stdout=(proc.stdout or "")[-50_000:],
-        stderr=(proc.stderr or "")[-50_000:],
+        stdout=_decode_tail(stdout_tail, _VERIFIER_OUTPUT_CHARS),
+        stderr=_decode_tail(stderr_tail, _VERIFIER_OUTPUT_CHARS),
+    )
+
+
+def _rule_input_to_edge(rule: KernelRuleInput) -> Hyperedge:
+    # Interned tokens hash once and compare by identity in later set operations.
+    return Hyperedge(
+        edge_id=rule.ruleId,
+        premises=frozenset(map(sys.intern, rule.premises)),
+        expected_outcome=sys.intern(rule.outcome),
+        note=rule.note,
     )
 
 
+_UNSAFE_DIR_CHARS_RE = re.compile(r"[^a-zA-Z0-9._-]+")
+
+
 def _sanitize_dir_component(value: str) -> str:
     trimmed = value.strip()
     if not trimmed:
         return "untitled"
-    safe = re.sub(r"[^a-zA-Z0-9._-]+", "-", trimmed)
+    safe = _UNSAFE_DIR_CHARS_RE.sub("-", trimmed)
     safe = safe.strip("-._")
     return safe or "untitled"
 
 
-def _incompat_to_response(pairs: tuple[dict[str, object], ...]) -> list[IncompatibilityPairResponse]:
-    result: list[IncompatibilityPairResponse] = []
-    for pair in pairs:
-        a = pair.get("a")
-        b = pair.get("b")
-        if isinstance(a, str) and isinstance(b, str):
-            result.append(IncompatibilityPairResponse(
-                a=a, b=b,
-                createdBy=str(pair.get("created_by", "")),
-                createdAt=str(pair.get("created_at", "")),
-            ))
-    return result
+_PRETTY_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
 
 
-def _infeasibility_to_response(entries: tuple[dict[str, object], ...]) -> list[InfeasibilityEntryResponse]:
-    result: list[InfeasibilityEntryResponse] = []
-    for entry in entries:
-        action = entry.get("action")
-        premises = entry.get("premises")
-        if isinstance(action, str) and isinstance(premises, list):
-            result.append(InfeasibilityEntryResponse(
-                action=action,
-                premises=[str(f) for f in premises],
-                createdBy=str(entry.get("created_by", "")),
-                createdAt=str(entry.get("created_at", "")),
-            ))
-    return result
+def _write_json(path: Path, data: object, *, pretty: bool = False) -> None:
+    """Write data as UTF-8 JSON; ``pretty`` indents by 2 and sorts keys.
 
+    orjson rejects some valid JSON values (integers beyond 64 bits), so
+    those payloads fall back to the stdlib encoder.
+    """
+    try:
+        body = orjson.dumps(data, option=_PRETTY_JSON_OPTIONS if pretty else None)
+    except orjson.JSONEncodeError:
+        text = json.dumps(data, indent=2, sort_keys=True) if pretty else json.dumps(data)
+        body = text.encode("utf-8")
+    path.write_bytes(body)
+
+
+_R = TypeVar("_R")
+_T = TypeVar("_T")
+_SECTION_CACHE_SIZE = 256
+
+
+def _memoize_by_identity(
+    convert: Callable[[tuple[_R, ...]], list[_T]],
+) -> Callable[[tuple[_R, ...]], list[_T]]:
+    """Memoize a section converter on the identity of its input tuple.
+
+    Store mutations replace only the section they touch and carry the other
+    tuples over unchanged, so an edit rebuilds just that section's response.
+    The input is kept alive in the cache, so its id() cannot be reused.
+    """
+    cache: OrderedDict[int, tuple[tuple[_R, ...], list[_T]]] = OrderedDict()
+    lock = Lock()
+
+    @wraps(convert)
+    def wrapper(items: tuple[_R, ...]) -> list[_T]:
+        key = id(items)
+        with lock:
+            cached = cache.get(key)
+            if cached is not None and cached[0] is items:
+                cache.move_to_end(key)
+                return cached[1]
+        result = convert(items)
+        with lock:
+            cache[key] = (items, result)
+            cache.move_to_end(key)
+            if len(cache) > _SECTION_CACHE_SIZE:
+                cache.popitem(last=False)
+        return result
+
+    return wrapper
+
+
+@_memoize_by_identity
+def _incompat_to_response(pairs: tuple[IncompatibilityPair, ...]) -> list[IncompatibilityPairResponse]:
+    construct = IncompatibilityPairResponse.model_construct
+    return [
+        construct(a=p.a, b=p.b, createdBy=p.created_by, createdAt=p.created_at)
+        for p in pairs
+    ]
 
-def _fact_exclusions_to_response(groups: tuple[dict[str, object], ...]) -> list[FactExclusionResponse]:
-    result: list[FactExclusionResponse] = []
-    for group in groups:
-        facts = group.get("facts")
-        if isinstance(facts, list):
-            result.append(FactExclusionResponse(
-                facts=[str(f) for f in facts],
-                createdBy=str(group.get("created_by", "")),
-                createdAt=str(group.get("created_at", "")),
-            ))
-    return result
+
+@_memoize_by_identity
+def _infeasibility_to_response(entries: tuple[InfeasibilityEntry, ...]) -> list[InfeasibilityEntryResponse]:
+    construct = InfeasibilityEntryResponse.model_construct
+    return [
+        construct(action=e.action, premises=list(e.premises), createdBy=e.created_by, createdAt=e.created_at)
+        for e in entries
+    ]
 
 
+@_memoize_by_identity
+def _fact_exclusions_to_response(groups: tuple[FactExclusionGroup, ...]) -> list[FactExclusionResponse]:
+    construct = FactExclusionResponse.model_construct
+    return [
+        construct(facts=list(g.facts), createdBy=g.created_by, createdAt=g.created_at)
+        for g in groups
+    ]
+
+
+@lru_cache(maxsize=1024)
 def _conflict_to_response(w: ConflictWarning) -> ConflictWarningResponse:
-    return ConflictWarningResponse(
+    return ConflictWarningResponse.model_construct(
         ruleAId=w.rule_a_id,
         ruleBId=w.rule_b_id,
         action=w.action,
@@ -291,25 +491,42 @@ def _conflict_to_response(w: ConflictWarning) -> ConflictWarningResponse:
     )
 
 
+def _artifact_sections(
+    manifest: KernelArtifactManifest,
+    rules: tuple[Hyperedge, ...],
+    provenance: dict[str, RuleProvenance],
+    incompatibility: tuple[IncompatibilityPair, ...],
+    infeasibility: tuple[InfeasibilityEntry, ...],
+    fact_exclusions: tuple[FactExclusionGroup, ...],
+) -> dict[str, object]:
+    """Fields shared by the active (draft) and runtime responses."""
+    return {
+        "manifest": _manifest_to_response(manifest),
+        "rulesetRuleCount": len(rules),
+        "ruleset": _rules_to_response(rules, provenance, manifest.updated_by, manifest.updated_at),
+        "incompatibilityPairCount": len(incompatibility),
+        "incompatibility": _incompat_to_response(incompatibility),
+        "infeasibilityEntryCount": len(infeasibility),
+        "infeasibility": _infeasibility_to_response(infeasibility),
+        "factExclusionCount": len(fact_exclusions),
+        "factExclusions": _fact_exclusions_to_response(fact_exclusions),
+    }
+
+
 def _draft_to_active_response(store: InMemoryKernelArtifactStore) -> KernelActiveArtifactsResponse:
-    draft = store.get_draft()
-    manifest = _manifest_to_response(draft.manifest)
-    ruleset = [
-        _rule_to_response(edge, draft.rule_provenance, draft.manifest.updated_by, draft.manifest.updated_at)
-        for edge in draft.proposals
-    ]
-    candidate = store.build_candidate_runtime_bundle()
+    return _active_response(*store.get_draft_and_candidate())
+
+
+def _active_response(
+    draft: KernelDraftProposals,
+    candidate: KernelArtifactBundle,
+) -> KernelActiveArtifactsResponse:
     warnings = detect_conflicts(candidate.ruleset)
-    return KernelActiveArtifactsResponse(
-        manifest=manifest,
-        rulesetRuleCount=len(draft.proposals),
-        ruleset=ruleset,
-        incompatibilityPairCount=len(draft.incompatibility),
-        incompatibility=_incompat_to_response(draft.incompatibility),
-        infeasibilityEntryCount=len(draft.infeasibility),
-        infeasibility=_infeasibility_to_response(draft.infeasibility),
-        factExclusionCount=len(draft.fact_exclusions),
-        factExclusions=_fact_exclusions_to_response(draft.fact_exclusions),
+    return KernelActiveArtifactsResponse.model_construct(
+        **_artifact_sections(
+            draft.manifest, draft.proposals, draft.rule_provenance,
+            draft.incompatibility, draft.infeasibility, draft.fact_exclusions,
+        ),
         proofReport={"status": "draft", "notes": "Pending proposals only."},
         conflictWarnings=[_conflict_to_response(w) for w in warnings],
     )
@@ -320,7 +537,7 @@ def _runtime_to_response(
     verification_payload: KernelRuntimeVerificationResponse,
 ) -> KernelRuntimeArtifactsResponse:
     if bundle is None:
-        return KernelRuntimeArtifactsResponse(
+        return KernelRuntimeArtifactsResponse.model_construct(
             verification=verification_payload,
             manifest=None,
             rulesetRuleCount=0,
@@ -332,22 +549,12 @@ def _runtime_to_response(
             proofReport={},
         )
 
-    manifest = _manifest_to_response(bundle.manifest)
-    ruleset = [
-        _rule_to_response(edge, bundle.rule_provenance, bundle.manifest.updated_by, bundle.manifest.updated_at)
-        for edge in bundle.ruleset
-    ]
-    return KernelRuntimeArtifactsResponse(
+    return KernelRuntimeArtifactsResponse.model_construct(
         verification=verification_payload,
-        manifest=manifest,
-        rulesetRuleCount=len(bundle.ruleset),
-        ruleset=ruleset,
-        incompatibilityPairCount=len(bundle.incompatibility),
-        incompatibility=_incompat_to_response(bundle.incompatibility),
-        infeasibilityEntryCount=len(bundle.infeasibility),
-        infeasibility=_infeasibility_to_response(bundle.infeasibility),
-        factExclusionCount=len(bundle.fact_exclusions),
-        factExclusions=_fact_exclusions_to_response(bundle.fact_exclusions),
+        **_artifact_sections(
+            bundle.manifest, bundle.ruleset, bundle.rule_provenance,
+            bundle.incompatibility, bundle.infeasibility, bundle.fact_exclusions,
+        ),
         proofReport=bundle.proof_report,
     )
 
@@ -358,17 +565,24 @@ def _runtime_to_response(
 
 
 @app.get("/health")
-def health_check() -> dict[str, str]:
+async def health_check() -> dict[str, str]:
     return {"status": "ok"}
 
 
-@app.get("/api/kernel/registry")
-def get_token_registry() -> dict[str, object]:
-    return _get_registry()
+@app.get("/api/kernel/registry", response_model=dict[str, object])
+async def get_token_registry(request: Request) -> Response:
+    coding = "gzip" if _accepts_gzip(request.headers.get("accept-encoding", "")) else "identity"
+    body, etag = _get_registry_payload()[coding]
+    headers = {"ETag": etag, "Cache-Control": "no-cache, no-transform", "Vary": "Accept-Encoding"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    if coding == "gzip":
+        headers["Content-Encoding"] = "gzip"
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @app.post("/api/ontology/normalize", response_model=OntologyNormalizeResponse)
-def normalize_ontology(payload: OntologyNormalizeRequest) -> OntologyNormalizeResponse:
+async def normalize_ontology(payload: OntologyNormalizeRequest) -> OntologyNormalizeResponse:
     try:
         normalized = normalize_ontology_input(
             OntologyInput(
@@ -385,14 +599,14 @@ def normalize_ontology(payload: OntologyNormalizeRequest) -> OntologyNormalizeRe
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
-    return OntologyNormalizeResponse(
+    return OntologyNormalizeResponse.model_construct(
         facts=normalized.facts,
         diagnosisFacts=normalized.diagnosis_facts,
         diagnosisAttributeFacts=normalized.diagnosis_attribute_facts,
         contextFacts=normalized.context_facts,
         actionToken=normalized.action_token,
         mappings=[
-            OntologyMappingResponse(
+            OntologyMappingResponse.model_construct(
                 sourceGroup=mapping.source_group,
                 sourceValue=mapping.source_value,
                 normalizedTokens=mapping.normalized_tokens,
@@ -403,102 +617,163 @@ def normalize_ontology(payload: OntologyNormalizeRequest) -> OntologyNormalizeRe
     )
 
 
-@app.post("/api/hypergraph/retrieve", response_model=HypergraphRetrieveResponse)
-def retrieve_hypergraph(payload: HypergraphRetrieveRequest, request: Request) -> HypergraphRetrieveResponse:
-    store = _get_session_store(request)
-    runtime_verification = store.get_runtime_verification()
-    if runtime_verification.status != "verified":
-        raise HTTPException(
-            status_code=412,
-            detail=(
-                "Runtime ruleset is not verified. "
-                "Publish a snapshot with verification enabled in Build to activate it."
-            ),
-        )
+_RETRIEVE_CACHE_SIZE = 256
+# (id(runtime ruleset), facts, proposed action) -> (ruleset, response). The
+# ruleset is kept in the value so a recycled id can never produce a stale hit.
+_retrieve_cache: OrderedDict[
+    tuple[int, frozenset[str], str | None],
+    tuple[tuple[Hyperedge, ...], HypergraphRetrieveResponse],
+] = OrderedDict()
+_retrieve_cache_lock = Lock()
 
-    facts = set(payload.facts)
-    candidate_edges: list[HypergraphCandidateEdgeResponse] = []
 
-    for edge in store.get_runtime_ruleset():
-        matching_premises = sorted(edge.premises.intersection(facts))
-        missing_premises = sorted(edge.premises.difference(facts))
+def _retrieve_from_ruleset(
+    ruleset: tuple[Hyperedge, ...],
+    facts: frozenset[str],
+    proposed_action: str | None,
+) -> HypergraphRetrieveResponse:
+    candidate_edges: list[HypergraphCandidateEdgeResponse] = []
+    matched_count = 0
+    outcomes: set[str] = set()
+    # The runtime ruleset is ordered by edge_id, so support lists come out sorted.
+    obligated_target = f"Obligated({proposed_action})" if proposed_action else None
+    allowed_target = f"Allowed({proposed_action})" if proposed_action else None
+    obligated_support: list[str] = []
+    allowed_support: list[str] = []
+
+    for edge in ruleset:
+        premises = edge.sorted_premises
+        matching_premises = [p for p in premises if p in facts]
+        missing_premises = [p for p in premises if p not in facts]
+        if not missing_premises:
+            outcome = edge.expected_outcome
+            matched_count += 1
+            outcomes.add(outcome)
+            if outcome == obligated_target:
+                obligated_support.append(edge.edge_id)
+            elif outcome == allowed_target:
+                allowed_support.append(edge.edge_id)
         candidate_edges.append(
-            HypergraphCandidateEdgeResponse(
+            HypergraphCandidateEdgeResponse.model_construct(
                 edgeId=edge.edge_id,
-                premises=sorted(edge.premises),
+                premises=list(premises),
                 expectedOutcome=edge.expected_outcome,
                 note=edge.note,
-                isMatched=len(missing_premises) == 0,
+                isMatched=not missing_premises,
                 matchingPremises=matching_premises,
                 missingPremises=missing_premises,
             )
         )
 
-    matched_edges = [edge for edge in candidate_edges if edge.isMatched]
-    derived_outcomes = sorted({edge.expectedOutcome for edge in matched_edges})
+    derived_outcomes = sorted(outcomes)
 
     verification: HypergraphVerificationSummaryResponse | None = None
-    if payload.proposedActionToken:
-        obligated_target = f"Obligated({payload.proposedActionToken})"
-        allowed_target = f"Allowed({payload.proposedActionToken})"
-
-        obligated_support = [edge.edgeId for edge in matched_edges if edge.expectedOutcome == obligated_target]
-        allowed_support = [edge.edgeId for edge in matched_edges if edge.expectedOutcome == allowed_target]
-
+    if proposed_action:
         if obligated_support:
-            verification = HypergraphVerificationSummaryResponse(
-                proposedActionToken=payload.proposedActionToken,
+            verification = HypergraphVerificationSummaryResponse.model_construct(
+                proposedActionToken=proposed_action,
                 isSupported=True,
                 supportLevel="obligated",
-                supportingEdgeIds=sorted(obligated_support),
+                supportingEdgeIds=obligated_support,
             )
         elif allowed_support:
-            verification = HypergraphVerificationSummaryResponse(
-                proposedActionToken=payload.proposedActionToken,
+            verification = HypergraphVerificationSummaryResponse.model_construct(
+                proposedActionToken=proposed_action,
                 isSupported=True,
                 supportLevel="allowed",
-                supportingEdgeIds=sorted(allowed_support),
+                supportingEdgeIds=allowed_support,
             )
         else:
-            verification = HypergraphVerificationSummaryResponse(
-                proposedActionToken=payload.proposedActionToken,
+            verification = HypergraphVerificationSummaryResponse.model_construct(
+                proposedActionToken=proposed_action,
                 isSupported=False,
                 supportLevel="unsupported",
                 supportingEdgeIds=[],
             )
 
-    return HypergraphRetrieveResponse(
+    return HypergraphRetrieveResponse.model_construct(
         candidateEdgeCount=len(candidate_edges),
-        matchedEdgeCount=len(matched_edges),
+        matchedEdgeCount=matched_count,
         derivedOutcomes=derived_outcomes,
         candidateEdges=candidate_edges,
         verification=verification,
     )
 
 
+@app.post("/api/hypergraph/retrieve", response_model=HypergraphRetrieveResponse)
+async def retrieve_hypergraph(payload: HypergraphRetrieveRequest, request: Request) -> HypergraphRetrieveResponse:
+    store = _get_session_store(request)
+    runtime, runtime_verification = store.get_runtime_state()
+    if runtime_verification.status != "verified" or runtime is None:
+        raise HTTPException(
+            status_code=412,
+            detail=(
+                "Runtime ruleset is not verified. "
+                "Publish a snapshot with verification enabled in Build to activate it."
+            ),
+        )
+
+    ruleset = runtime.ruleset
+    facts = frozenset(map(sys.intern, payload.facts))
+    cache_key = (id(ruleset), facts, payload.proposedActionToken)
+    with _retrieve_cache_lock:
+        cached = _retrieve_cache.get(cache_key)
+        if cached is not None and cached[0] is ruleset:
+            _retrieve_cache.move_to_end(cache_key)
+            return cached[1]
+
+    response = _retrieve_from_ruleset(ruleset, facts, payload.proposedActionToken)
+    with _retrieve_cache_lock:
+        _retrieve_cache[cache_key] = (ruleset, response)
+        _retrieve_cache.move_to_end(cache_key)
+        if len(_retrieve_cache) > _RETRIEVE_CACHE_SIZE:
+            _retrieve_cache.popitem(last=False)
+    return response
+
+
+# Drafts and candidate bundles are replaced, never mutated, so the serialized
+# active response is reused per store until either object changes.
+_active_response_cache: WeakKeyDictionary[
+    InMemoryKernelArtifactStore,
+    tuple[KernelDraftProposals, KernelArtifactBundle, bytes, str],
+] = WeakKeyDictionary()
+
+
+def _body_etag(body: bytes) -> str:
+    digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+    return f'"{digest}"'
+
+
+def _session_json_response(request: Request, body: bytes, etag: str) -> Response:
+    """Serve per-session JSON with a validator so polling clients can get a 304."""
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "x-session-id"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @app.get("/api/kernel/active", response_model=KernelActiveArtifactsResponse)
-def get_active_kernel_artifacts(request: Request) -> KernelActiveArtifactsResponse:
+async def get_active_kernel_artifacts(request: Request) -> Response:
     store = _get_session_store(request)
-    return _draft_to_active_response(store)
+    draft, candidate = store.get_draft_and_candidate()
+    cached = _active_response_cache.get(store)
+    if cached is not None and cached[0] is draft and cached[1] is candidate:
+        return _session_json_response(request, cached[2], cached[3])
+
+    body = _active_response(draft, candidate).model_dump_json().encode("utf-8")
+    etag = _body_etag(body)
+    _active_response_cache[store] = (draft, candidate, body, etag)
+    return _session_json_response(request, body, etag)
 
 
 @app.put("/api/kernel/active/ruleset", response_model=KernelActiveArtifactsResponse)
-def replace_active_ruleset(payload: KernelReplaceRulesetRequest, request: Request) -> KernelActiveArtifactsResponse:
+async def replace_active_ruleset(payload: KernelReplaceRulesetRequest, request: Request) -> KernelActiveArtifactsResponse:
     rule_ids = [rule.ruleId for rule in payload.ruleset]
     if len(set(rule_ids)) != len(rule_ids):
         raise HTTPException(status_code=400, detail="Ruleset contains duplicate ruleId values.")
 
     store = _get_session_store(request)
-    edges: list[Hyperedge] = []
-    for rule in payload.ruleset:
-        edges.append(
-            Hyperedge(
-                edge_id=rule.ruleId,
-                premises=frozenset(rule.premises),
-                expected_outcome=rule.outcome,
-                note=rule.note,
-            )
-        )
+    edges = [_rule_input_to_edge(rule) for rule in payload.ruleset]
 
     store.replace_draft_proposals(
         ruleset_version=payload.rulesetVersion,
@@ -513,16 +788,11 @@ def replace_active_ruleset(payload: KernelReplaceRulesetRequest, request: Reques
 
 
 @app.post("/api/kernel/active/rules", response_model=KernelActiveArtifactsResponse)
-def add_rule(payload: KernelRuleInput, request: Request) -> KernelActiveArtifactsResponse:
+async def add_rule(payload: KernelRuleInput, request: Request) -> KernelActiveArtifactsResponse:
     _validate_outcome_token(payload.outcome)
     _validate_fact_tokens(payload.premises)
     store = _get_session_store(request)
-    edge = Hyperedge(
-        edge_id=payload.ruleId,
-        premises=frozenset(payload.premises),
-        expected_outcome=payload.outcome,
-        note=payload.note,
-    )
+    edge = _rule_input_to_edge(payload)
     try:
         store.add_rule(edge=edge, created_by=payload.createdBy)
     except ValueError as exc:
@@ -531,16 +801,11 @@ def add_rule(payload: KernelRuleInput, request: Request) -> KernelActiveArtifact
 
 
 @app.put("/api/kernel/active/rules/{rule_id}", response_model=KernelActiveArtifactsResponse)
-def update_rule(rule_id: str, payload: KernelRuleInput, request: Request) -> KernelActiveArtifactsResponse:
+async def update_rule(rule_id: str, payload: KernelRuleInput, request: Request) -> KernelActiveArtifactsResponse:
     _validate_outcome_token(payload.outcome)
     _validate_fact_tokens(payload.premises)
     store = _get_session_store(request)
-    edge = Hyperedge(
-        edge_id=payload.ruleId,
-        premises=frozenset(payload.premises),
-        expected_outcome=payload.outcome,
-        note=payload.note,
-    )
+    edge = _rule_input_to_edge(payload)
     try:
         store.update_rule(rule_id=rule_id, edge=edge, updated_by=payload.createdBy)
     except KeyError as exc:
@@ -549,7 +814,7 @@ def update_rule(rule_id: str, payload: KernelRuleInput, request: Request) -> Ker
 
 
 @app.delete("/api/kernel/active/rules/{rule_id}", response_model=KernelActiveArtifactsResponse)
-def delete_rule(rule_id: str, request: Request) -> KernelActiveArtifactsResponse:
+async def delete_rule(rule_id: str, request: Request) -> KernelActiveArtifactsResponse:
     store = _get_session_store(request)
     try:
         store.remove_rule(rule_id=rule_id, updated_by="anonymous")
@@ -562,7 +827,7 @@ def delete_rule(rule_id: str, request: Request) -> KernelActiveArtifactsResponse
 
 
 @app.post("/api/kernel/active/incompatibility", response_model=KernelActiveArtifactsResponse)
-def add_incompatibility_pair(payload: IncompatibilityPairInput, request: Request) -> KernelActiveArtifactsResponse:
+async def add_incompatibility_pair(payload: IncompatibilityPairInput, request: Request) -> KernelActiveArtifactsResponse:
     _validate_action_token(payload.a)
     _validate_action_token(payload.b)
     store = _get_session_store(request)
@@ -574,7 +839,7 @@ def add_incompatibility_pair(payload: IncompatibilityPairInput, request: Request
 
 
 @app.put("/api/kernel/active/incompatibility/{index}", response_model=KernelActiveArtifactsResponse)
-def update_incompatibility_pair(index: int, payload: IncompatibilityPairInput, request: Request) -> KernelActiveArtifactsResponse:
+async def update_incompatibility_pair(index: int, payload: IncompatibilityPairInput, request: Request) -> KernelActiveArtifactsResponse:
     _validate_action_token(payload.a)
     _validate_action_token(payload.b)
     store = _get_session_store(request)
@@ -586,7 +851,7 @@ def update_incompatibility_pair(index: int, payload: IncompatibilityPairInput, r
 
 
 @app.delete("/api/kernel/active/incompatibility/{index}", response_model=KernelActiveArtifactsResponse)
-def delete_incompatibility_pair(index: int, request: Request) -> KernelActiveArtifactsResponse:
+async def delete_incompatibility_pair(index: int, request: Request) -> KernelActiveArtifactsResponse:
     store = _get_session_store(request)
     try:
         store.remove_incompatibility_pair(index=index, updated_by="anonymous")
@@ -599,7 +864,7 @@ def delete_incompatibility_pair(index: int, request: Request) -> KernelActiveArt
 
 
 @app.post("/api/kernel/active/infeasibility", response_model=KernelActiveArtifactsResponse)
-def add_infeasibility_entry(payload: InfeasibilityEntryInput, request: Request) -> KernelActiveArtifactsResponse:
+async def add_infeasibility_entry(payload: InfeasibilityEntryInput, request: Request) -> KernelActiveArtifactsResponse:
     _validate_action_token(payload.action)
     _validate_fact_tokens(payload.premises)
     store = _get_session_store(request)
@@ -613,7 +878,7 @@ def add_infeasibility_entry(payload: InfeasibilityEntryInput, request: Request)
 
 
 @app.put("/api/kernel/active/infeasibility/{index}", response_model=KernelActiveArtifactsResponse)
-def update_infeasibility_entry(index: int, payload: InfeasibilityEntryInput, request: Request) -> KernelActiveArtifactsResponse:
+async def update_infeasibility_entry(index: int, payload: InfeasibilityEntryInput, request: Request) -> KernelActiveArtifactsResponse:
     _validate_action_token(payload.action)
     _validate_fact_tokens(payload.premises)
     store = _get_session_store(request)
@@ -627,7 +892,7 @@ def update_infeasibility_entry(index: int, payload: InfeasibilityEntryInput, req
 
 
 @app.delete("/api/kernel/active/infeasibility/{index}", response_model=KernelActiveArtifactsResponse)
-def delete_infeasibility_entry(index: int, request: Request) -> KernelActiveArtifactsResponse:
+async def delete_infeasibility_entry(index: int, request: Request) -> KernelActiveArtifactsResponse:
     store = _get_session_store(request)
     try:
         store.remove_infeasibility_entry(index=index, updated_by="anonymous")
@@ -637,7 +902,7 @@ def delete_infeasibility_entry(index: int, request: Request) -> KernelActiveArti
 
 
 @app.post("/api/kernel/active/fact-exclusions", response_model=KernelActiveArtifactsResponse)
-def add_fact_exclusion(payload: FactExclusionInput, request: Request) -> KernelActiveArtifactsResponse:
+async def add_fact_exclusion(payload: FactExclusionInput, request: Request) -> KernelActiveArtifactsResponse:
     _validate_fact_tokens(payload.facts)
     store = _get_session_store(request)
     try:
@@ -648,7 +913,7 @@ def add_fact_exclusion(payload: FactExclusionInput, request: Request) -> KernelA
 
 
 @app.delete("/api/kernel/active/fact-exclusions/{index}", response_model=KernelActiveArtifactsResponse)
-def delete_fact_exclusion(index: int, request: Request) -> KernelActiveArtifactsResponse:
+async def delete_fact_exclusion(index: int, request: Request) -> KernelActiveArtifactsResponse:
     store = _get_session_store(request)
     try:
         store.remove_fact_exclusion(index=index, updated_by="anonymous")
@@ -657,36 +922,76 @@ def delete_fact_exclusion(index: int, request: Request) -> KernelActiveArtifacts
     return _draft_to_active_response(store)
 
 
+# Runtime responses only change when the store swaps its bundle or verification
+# status, so their serialized JSON is reused per store until either is replaced.
+_runtime_response_cache: WeakKeyDictionary[
+    InMemoryKernelArtifactStore,
+    tuple[KernelArtifactBundle | None, KernelVerificationStatus, bytes, str],
+] = WeakKeyDictionary()
+
+
 @app.get("/api/kernel/runtime", response_model=KernelRuntimeArtifactsResponse)
-def get_runtime_kernel_artifacts(request: Request) -> KernelRuntimeArtifactsResponse:
+async def get_runtime_kernel_artifacts(request: Request) -> Response:
     store = _get_session_store(request)
-    runtime = store.get_runtime_bundle()
-    verification = store.get_runtime_verification()
-    verification_payload = KernelRuntimeVerificationResponse(
+    runtime, verification = store.get_runtime_state()
+    cached = _runtime_response_cache.get(store)
+    if cached is not None and cached[0] is runtime and cached[1] is verification:
+        return _session_json_response(request, cached[2], cached[3])
+
+    verification_payload = KernelRuntimeVerificationResponse.model_construct(
         status=verification.status,
         verifiedAt=verification.verified_at.isoformat() if verification.verified_at else None,
         verifiedBy=verification.verified_by,
         verifiedSnapshotDir=verification.verified_snapshot_dir,
     )
-    return _runtime_to_response(runtime, verification_payload)
+    body = _runtime_to_response(runtime, verification_payload).model_dump_json().encode("utf-8")
+    etag = _body_etag(body)
+    _runtime_response_cache[store] = (runtime, verification, body, etag)
+    return _session_json_response(request, body, etag)
+
+
+_SNAPSHOT_LIST_CACHE_SIZE = 100
+# Session artifact dir -> (dir mtime_ns, JSON-encoded listing).
+_snapshot_list_cache: OrderedDict[Path, tuple[int, bytes]] = OrderedDict()
+_snapshot_list_lock = Lock()
 
 
-@app.get("/api/kernel/snapshots")
-def list_snapshots(request: Request) -> list[dict[str, str]]:
+@app.get("/api/kernel/snapshots", response_model=list[dict[str, str]])
+def list_snapshots(request: Request) -> Response:
     base_dir = _get_session_artifact_dir(request)
-    if not base_dir.is_dir():
-        return []
-    entries: list[dict[str, str]] = []
-    for child in sorted(base_dir.iterdir(), reverse=True):
-        if child.is_dir():
-            stat = child.stat()
-            created = datetime.fromtimestamp(stat.st_ctime, tz=timezone.utc).isoformat()
-            entries.append({
-                "directory": str(child),
-                "name": child.name,
-                "createdAt": created,
-            })
-    return entries[:50]
+    try:
+        base_stat = base_dir.stat()
+    except OSError:
+        return Response(content=b"[]", media_type="application/json")
+    if not stat_module.S_ISDIR(base_stat.st_mode):
+        return Response(content=b"[]", media_type="application/json")
+
+    # Publishing adds a child directory, which bumps the parent's mtime.
+    with _snapshot_list_lock:
+        cached = _snapshot_list_cache.get(base_dir)
+        if cached is not None and cached[0] == base_stat.st_mtime_ns:
+            _snapshot_list_cache.move_to_end(base_dir)
+            return Response(content=cached[1], media_type="application/json")
+
+    # DirEntry caches is_dir()/stat(), and only the newest 50 names are kept.
+    with os.scandir(base_dir) as it:
+        newest = heapq.nlargest(50, (e for e in it if e.is_dir()), key=lambda e: e.name)
+    entries = [
+        {
+            "directory": entry.path,
+            "name": entry.name,
+            "createdAt": datetime.fromtimestamp(entry.stat().st_ctime, tz=timezone.utc).isoformat(),
+        }
+        for entry in newest
+    ]
+    body = json.dumps(entries, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    with _snapshot_list_lock:
+        _snapshot_list_cache[base_dir] = (base_stat.st_mtime_ns, body)
+        _snapshot_list_cache.move_to_end(base_dir)
+        if len(_snapshot_list_cache) > _SNAPSHOT_LIST_CACHE_SIZE:
+            _snapshot_list_cache.popitem(last=False)
+    return Response(content=body, media_type="application/json")
 
 
 @app.post("/api/kernel/publish", response_model=KernelPublishSnapshotResponse)
@@ -695,8 +1000,7 @@ def publish_active_kernel_snapshot(
     request: Request,
 ) -> KernelPublishSnapshotResponse:
     store = _get_session_store(request)
-    draft = store.get_draft()
-    bundle = store.build_candidate_runtime_bundle()
+    draft, bundle = store.get_draft_and_candidate()
 
     unresolvable = [w for w in detect_conflicts(bundle.ruleset) if not w.resolvable]
     if unresolvable:
@@ -708,7 +1012,8 @@ def publish_active_kernel_snapshot(
 
     base_dir = _get_session_artifact_dir(request)
 
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    published_at = datetime.now(timezone.utc)
+    timestamp = published_at.strftime("%Y%m%dT%H%M%SZ")
     safe_version = _sanitize_dir_component(bundle.manifest.ruleset_version)
     snapshot_dir = base_dir / f"{safe_version}--r{bundle.manifest.revision}--{timestamp}"
 
@@ -726,36 +1031,32 @@ def publish_active_kernel_snapshot(
         "updatedAt": bundle.manifest.updated_at.isoformat(),
         "updatedBy": bundle.manifest.updated_by,
         "changeSummary": bundle.manifest.change_summary,
-        "publishedAt": datetime.now(timezone.utc).isoformat(),
+        "publishedAt": published_at.isoformat(),
         "note": "Preview snapshot (no persistence guarantees).",
     }
 
-    verdict_pattern = re.compile(r"^(Obligated|Allowed|Disallowed|Rejected)\((.+)\)$")
     rules: list[dict[str, object]] = []
     actions: set[str] = set()
     facts: set[str] = set()
 
-    for edge in sorted(bundle.ruleset, key=lambda item: item.edge_id):
-        match = verdict_pattern.match(edge.expected_outcome.strip())
-        if not match:
-            continue
-        kind = match.group(1)
-        action = match.group(2).strip()
-        if not action:
+    # Candidate bundles are already ordered by edge_id.
+    for edge in bundle.ruleset:
+        # Conflict detection above already parsed (and cached) these outcomes.
+        verdict = parse_verdict(edge.expected_outcome)
+        if verdict is None or not verdict.action:
             continue
+        kind = verdict.kind
+        action = verdict.action
         prov = bundle.rule_provenance.get(edge.edge_id)
-        source_chunks = []
-        if prov is not None:
-            source_chunks.append(f"by={prov.created_by}")
-            source_chunks.append(f"at={prov.created_at.isoformat()}")
+        source = prov.source_label if prov is not None else None
         if edge.note:
-            source_chunks.append(edge.note)
+            source = f"{source} | {edge.note}" if source else edge.note
         rules.append(
             {
                 "id": edge.edge_id,
-                "premises": sorted(edge.premises),
+                "premises": list(edge.sorted_premises),
                 "out": {"kind": kind, "action": action},
-                "source": " | ".join(source_chunks) if source_chunks else None,
+                "source": source,
             }
         )
         actions.add(action)
@@ -763,19 +1064,13 @@ def publish_active_kernel_snapshot(
 
     infeasibility_entries: list[dict[str, object]] = []
     for entry in bundle.infeasibility:
-        action = entry.get("action")
-        premises = entry.get("premises")
-        if isinstance(action, str) and isinstance(premises, list):
-            infeasibility_entries.append(
-                {"action": action, "premises": [str(item) for item in premises]}
-            )
-            actions.add(action)
-            facts.update(str(item) for item in premises)
+        infeasibility_entries.append({"action": entry.action, "premises": list(entry.premises)})
+        actions.add(entry.action)
+        facts.update(entry.premises)
 
-    domain = os.getenv("KERNEL_DOMAIN", "obstetrics").strip() or "obstetrics"
     ruleset_payload = {
         "version": draft.manifest.ruleset_version,
-        "domain": domain,
+        "domain": _KERNEL_DOMAIN,
         "facts": sorted(facts),
         "actions": sorted(actions),
         "rules": rules,
@@ -783,7 +1078,7 @@ def publish_active_kernel_snapshot(
     }
     incompat_payload = {
         "version": draft.manifest.ruleset_version,
-        "pairs": [{"a": str(p["a"]), "b": str(p["b"])} for p in bundle.incompatibility if "a" in p and "b" in p],
+        "pairs": [{"a": p.a, "b": p.b} for p in bundle.incompatibility],
         "notes": "Published from in-memory kernel artifact store.",
     }
     infeasibility_payload = {
@@ -793,11 +1088,7 @@ def publish_active_kernel_snapshot(
     }
     fact_exclusions_payload = {
         "version": draft.manifest.ruleset_version,
-        "groups": [
-            {"facts": [str(f) for f in g.get("facts", [])]}
-            for g in bundle.fact_exclusions
-            if isinstance(g.get("facts"), list)
-        ],
+        "groups": [{"facts": list(g.facts)} for g in bundle.fact_exclusions],
         "notes": "Published from in-memory kernel artifact store.",
     }
 
@@ -811,12 +1102,12 @@ def publish_active_kernel_snapshot(
     }
 
     try:
-        files["manifest"].write_text(json.dumps(manifest_payload, indent=2, sort_keys=True), encoding="utf-8")
-        files["ruleset"].write_text(json.dumps(ruleset_payload, indent=2, sort_keys=True), encoding="utf-8")
-        files["incompatibility"].write_text(json.dumps(incompat_payload, indent=2, sort_keys=True), encoding="utf-8")
-        files["infeasibility"].write_text(json.dumps(infeasibility_payload, indent=2, sort_keys=True), encoding="utf-8")
-        files["factExclusions"].write_text(json.dumps(fact_exclusions_payload, indent=2, sort_keys=True), encoding="utf-8")
-        files["proofReport"].write_text(json.dumps(bundle.proof_report, indent=2, sort_keys=True), encoding="utf-8")
+        _write_json(files["manifest"], manifest_payload, pretty=True)
+        _write_json(files["ruleset"], ruleset_payload, pretty=True)
+        _write_json(files["incompatibility"], incompat_payload, pretty=True)
+        _write_json(files["infeasibility"], infeasibility_payload, pretty=True)
+        _write_json(files["factExclusions"], fact_exclusions_payload, pretty=True)
+        _write_json(files["proofReport"], bundle.proof_report, pretty=True)
     except OSError as exc:
         raise HTTPException(status_code=500, detail=f"Failed to write snapshot files: {exc}") from exc
 
@@ -827,9 +1118,9 @@ def publish_active_kernel_snapshot(
 
     if use_certificate:
         try:
-            cert_path = write_certificate(
-                snapshot_dir, files["ruleset"], files["incompatibility"], files["infeasibility"],
-                fact_exclusions_path=files["factExclusions"],
+            cert_path = write_certificate_from_payloads(
+                snapshot_dir, ruleset_payload, incompat_payload, infeasibility_payload,
+                fact_exclusions=fact_exclusions_payload,
             )
             files["certificate"] = cert_path
             cert_generated = True
@@ -863,9 +1154,10 @@ def publish_active_kernel_snapshot(
             "stdout": cert_verify.stdout,
             "stderr": cert_verify.stderr,
             "durationMs": cert_verify.duration_ms,
+            "cached": cert_verify.cached,
         }
 
-    return KernelPublishSnapshotResponse(
+    return KernelPublishSnapshotResponse.model_construct(
         directory=str(snapshot_dir),
         manifest=_manifest_to_response(draft.manifest),
         files={key: str(path) for key, path in files.items()},
@@ -887,11 +1179,11 @@ def verify_cohere_artifacts(payload: CohereVerifyRequest) -> CohereVerifyRespons
         exclusions_path = tmp_path / "fact_exclusions.json"
 
         try:
-            rules_path.write_text(json.dumps(payload.ruleset), encoding="utf-8")
-            incompat_path.write_text(json.dumps(payload.incompatibility), encoding="utf-8")
-            infeas_path.write_text(json.dumps(payload.infeasibility), encoding="utf-8")
+            _write_json(rules_path, payload.ruleset)
+            _write_json(incompat_path, payload.incompatibility)
+            _write_json(infeas_path, payload.infeasibility)
             fe_data = payload.factExclusions if payload.factExclusions is not None else {"groups": []}
-            exclusions_path.write_text(json.dumps(fe_data), encoding="utf-8")
+            _write_json(exclusions_path, fe_data)
         except OSError as exc:
             raise HTTPException(status_code=500, detail=f"Failed to write temp files: {exc}") from exc
 
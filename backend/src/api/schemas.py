@@ -5,6 +5,14 @@ from typing import Any
 from pydantic import BaseModel, Field, field_validator
 
 
+def _string_list_or_empty(value: object, message: str) -> object:
+    if value is None:
+        return []
+    if not isinstance(value, list):
+        raise TypeError(message)
+    return value
+
+
 class OntologyNormalizeRequest(BaseModel):
     selectedDiagnoses: list[str] = Field(default_factory=list)
     diagnosisAttributesByDiagnosis: dict[str, list[str]] = Field(default_factory=dict)
@@ -23,14 +31,7 @@ class OntologyNormalizeRequest(BaseModel):
     )
     @classmethod
     def validate_list_values(cls, value: object) -> object:
-        if value is None:
-            return []
-        if not isinstance(value, list):
-            raise TypeError("Expected an array of strings.")
-        for item in value:
-            if not isinstance(item, str):
-                raise TypeError("All selected values must be strings.")
-        return value
+        return _string_list_or_empty(value, "Expected an array of strings.")
 
     @field_validator("diagnosisAttributesByDiagnosis", mode="before")
     @classmethod
@@ -39,16 +40,7 @@ class OntologyNormalizeRequest(BaseModel):
             return {}
         if not isinstance(value, dict):
             raise TypeError("Expected diagnosisAttributesByDiagnosis to be an object.")
-        validated: dict[str, list[str]] = {}
-        for key, attributes in value.items():
-            if not isinstance(key, str):
-                raise TypeError("Diagnosis IDs must be strings.")
-            if not isinstance(attributes, list) or not all(
-                isinstance(attribute, str) for attribute in attributes
-            ):
-                raise TypeError("Diagnosis attribute values must be arrays of strings.")
-            validated[key] = attributes
-        return validated
+        return value
 
 
 class OntologyMappingResponse(BaseModel):
@@ -74,14 +66,7 @@ class HypergraphRetrieveRequest(BaseModel):
     @field_validator("facts", mode="before")
     @classmethod
     def validate_facts(cls, value: object) -> object:
-        if value is None:
-            return []
-        if not isinstance(value, list):
-            raise TypeError("Expected facts to be an array of strings.")
-        for item in value:
-            if not isinstance(item, str):
-                raise TypeError("All facts must be strings.")
-        return value
+        return _string_list_or_empty(value, "Expected facts to be an array of strings.")
 
 
 class HypergraphCandidateEdgeResponse(BaseModel):
@@ -128,14 +113,7 @@ class KernelRuleInput(BaseModel):
     @field_validator("premises", mode="before")
     @classmethod
     def validate_premises(cls, value: object) -> object:
-        if value is None:
-            return []
-        if not isinstance(value, list):
-            raise TypeError("Expected premises to be an array of strings.")
-        for item in value:
-            if not isinstance(item, str):
-                raise TypeError("All premises must be strings.")
-        return value
+        return _string_list_or_empty(value, "Expected premises to be an array of strings.")
 
 
 class IncompatibilityPairResponse(BaseModel):
@@ -166,14 +144,7 @@ class InfeasibilityEntryInput(BaseModel):
     @field_validator("premises", mode="before")
     @classmethod
     def validate_premises(cls, value: object) -> object:
-        if value is None:
-            return []
-        if not isinstance(value, list):
-            raise TypeError("Expected an array of strings.")
-        for item in value:
-            if not isinstance(item, str):
-                raise TypeError("All facts must be strings.")
-        return value
+        return _string_list_or_empty(value, "Expected an array of strings.")
 
 
 class FactExclusionResponse(BaseModel):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 
 
 @dataclass(frozen=True)
@@ -9,3 +10,8 @@ class Hyperedge:
     premises: frozenset[str]
     expected_outcome: str
     note: str
+
+    @cached_property
+    def sorted_premises(self) -> tuple[str, ...]:
+        """Premises in sorted order, computed once per (immutable) edge."""
+        return tuple(sorted(self.premises))
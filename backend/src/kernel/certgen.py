@@ -12,13 +12,26 @@ certificate that can be independently verified by anyone with Lean 4.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import shutil
 import subprocess
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, replace
 from pathlib import Path
+from threading import Lock
+from typing import Any
+
+
+_CERTIFICATE_IMPORTS: tuple[str, ...] = (
+    "Cohere.Runtime.Verifier",
+    "Cohere.Runtime.InvariantChecks",
+    "Cohere.Runtime.ActionAlgebraB",
+    "Cohere.Runtime.FactConstraintsB",
+    "Cohere.Runtime.BoolUtils",
+)
 
 
 def _lean_str(s: str) -> str:
@@ -32,19 +45,26 @@ def _lean_str_list(items: list[str]) -> str:
     return f"[{inner}]"
 
 
+_VERDICT_CONSTRUCTORS = {
+    "Obligated": ".Obligated",
+    "Allowed": ".Allowed",
+    "Disallowed": ".Disallowed",
+    "Rejected": ".Rejected",
+}
+
+
 def _verdict_constructor(kind: str) -> str:
-    mapping = {
-        "Obligated": ".Obligated",
-        "Allowed": ".Allowed",
-        "Disallowed": ".Disallowed",
-        "Rejected": ".Rejected",
-    }
-    ctor = mapping.get(kind)
+    ctor = _VERDICT_CONSTRUCTORS.get(kind)
     if ctor is None:
         raise ValueError(f"Unknown verdict kind: {kind}")
     return ctor
 
 
+def _load_json(path: Path) -> dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
 def generate_certificate_lean(
     ruleset_path: Path,
     incompatibility_path: Path,
@@ -53,17 +73,27 @@ def generate_certificate_lean(
 ) -> str:
     """Return the contents of a Lean 4 proof certificate file."""
 
-    with open(ruleset_path, encoding="utf-8") as f:
-        ruleset = json.load(f)
-    with open(incompatibility_path, encoding="utf-8") as f:
-        incompat = json.load(f)
-    with open(infeasibility_path, encoding="utf-8") as f:
-        infeas = json.load(f)
+    return render_certificate_lean(
+        _load_json(ruleset_path),
+        _load_json(incompatibility_path),
+        _load_json(infeasibility_path),
+        _load_json(fact_exclusions_path) if fact_exclusions_path is not None else None,
+    )
+
+
+def render_certificate_lean(
+    ruleset: dict[str, Any],
+    incompat: dict[str, Any],
+    infeas: dict[str, Any],
+    fact_exclusions: dict[str, Any] | None = None,
+) -> str:
+    """Return certificate contents from already-parsed snapshot payloads."""
+
     exclusion_groups: list[list[str]] = []
-    if fact_exclusions_path is not None:
-        with open(fact_exclusions_path, encoding="utf-8") as f:
-            fe_data = json.load(f)
-        exclusion_groups = [g["facts"] for g in fe_data.get("groups", []) if isinstance(g.get("facts"), list)]
+    if fact_exclusions is not None:
+        exclusion_groups = [
+            g["facts"] for g in fact_exclusions.get("groups", []) if isinstance(g.get("facts"), list)
+        ]
 
     rules = ruleset.get("rules", [])
     actions = ruleset.get("actions", [])
@@ -87,11 +117,8 @@ def generate_certificate_lean(
     emit("  verification: if `lake env lean certificate.lean` succeeds, the three")
     emit("  kernel invariants hold for ALL 2^N subsets of the fact universe.")
     emit("-/")
-    emit("import Cohere.Runtime.Verifier")
-    emit("import Cohere.Runtime.InvariantChecks")
-    emit("import Cohere.Runtime.ActionAlgebraB")
-    emit("import Cohere.Runtime.FactConstraintsB")
-    emit("import Cohere.Runtime.BoolUtils")
+    for module in _CERTIFICATE_IMPORTS:
+        emit(f"import {module}")
     emit()
     emit("open Cohere.Runtime")
     emit("open Cohere.Types")
@@ -217,6 +244,22 @@ def write_certificate(
     content = generate_certificate_lean(
         ruleset_path, incompatibility_path, infeasibility_path, fact_exclusions_path,
     )
+    return _write_certificate_text(snapshot_dir, content)
+
+
+def write_certificate_from_payloads(
+    snapshot_dir: Path,
+    ruleset: dict[str, Any],
+    incompat: dict[str, Any],
+    infeas: dict[str, Any],
+    fact_exclusions: dict[str, Any] | None = None,
+) -> Path:
+    """Like `write_certificate`, but skips re-reading snapshot files the caller just wrote."""
+    content = render_certificate_lean(ruleset, incompat, infeas, fact_exclusions)
+    return _write_certificate_text(snapshot_dir, content)
+
+
+def _write_certificate_text(snapshot_dir: Path, content: str) -> Path:
     cert_path = snapshot_dir / "certificate.lean"
     cert_path.write_text(content, encoding="utf-8")
     return cert_path
@@ -229,6 +272,38 @@ class CertificateVerifyResult:
     stdout: str
     stderr: str
     duration_ms: int
+    cached: bool = False
+
+
+# (lean binary, LEAN_PATH, subprocess env), resolved on first successful lookup.
+# Missing toolchains are not cached so installing Lean later needs no restart.
+_toolchain_cache: tuple[str, str, dict[str, str]] | None = None
+
+_VERIFIED_CACHE_SIZE = 512
+# (certificate sha256, lean binary, LEAN_PATH, build identity) -> successful result.
+_verified_cache: OrderedDict[
+    tuple[str, str, str, tuple[tuple[int, int], ...]], CertificateVerifyResult
+] = OrderedDict()
+_verified_cache_lock = Lock()
+
+
+def _build_identity(lean_bin: str, lean_path: str) -> tuple[tuple[int, int], ...]:
+    """(mtime_ns, size) of the lean binary and each imported Cohere .olean.
+
+    Rebuilding the Cohere library or upgrading Lean changes this, so earlier
+    successful compiles are not reused against a different build.
+    """
+    paths = [Path(lean_bin)]
+    paths.extend(Path(lean_path, *module.split(".")).with_suffix(".olean") for module in _CERTIFICATE_IMPORTS)
+    identity: list[tuple[int, int]] = []
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            identity.append((-1, -1))
+            continue
+        identity.append((st.st_mtime_ns, st.st_size))
+    return tuple(identity)
 
 
 def verify_certificate(cert_path: Path, timeout_seconds: int = 120) -> CertificateVerifyResult:
@@ -236,25 +311,51 @@ def verify_certificate(cert_path: Path, timeout_seconds: int = 120) -> Certifica
 
     Requires the Lean toolchain and the pre-built Cohere library to be
     available (set COHERE_LIB_DIR to the Cohere project root).
+
+    Successful compilations are memoized by certificate content and the
+    toolchain/library build, so re-publishing an unchanged ruleset skips the
+    Lean run; such results come back with ``cached=True``, a zero duration
+    and no stdout/stderr, since the original output names the snapshot path
+    of whichever session compiled it first. Failures are not cached: their
+    output may be transient.
     """
-    cohere_lib = os.getenv("COHERE_LIB_DIR", "")
-    if not cohere_lib or not Path(cohere_lib).is_dir():
-        return CertificateVerifyResult(
-            ok=False, exit_code=-1, stdout="",
-            stderr="COHERE_LIB_DIR not set or not found. Certificate verification skipped.",
-            duration_ms=0,
-        )
+    global _toolchain_cache  # noqa: PLW0603
+    toolchain = _toolchain_cache
+    if toolchain is None:
+        cohere_lib = os.getenv("COHERE_LIB_DIR", "")
+        if not cohere_lib or not Path(cohere_lib).is_dir():
+            return CertificateVerifyResult(
+                ok=False, exit_code=-1, stdout="",
+                stderr="COHERE_LIB_DIR not set or not found. Certificate verification skipped.",
+                duration_ms=0,
+            )
+
+        lean_bin = shutil.which("lean")
+        if lean_bin is None:
+            return CertificateVerifyResult(
+                ok=False, exit_code=-1, stdout="",
+                stderr="lean binary not found on PATH. Certificate verification skipped.",
+                duration_ms=0,
+            )
+
+        lean_path = str(Path(cohere_lib) / ".lake" / "build" / "lib")
+        toolchain = _toolchain_cache = (lean_bin, lean_path, {**os.environ, "LEAN_PATH": lean_path})
+    lean_bin, lean_path, env = toolchain
 
-    lean_bin = shutil.which("lean")
-    if lean_bin is None:
+    try:
+        digest = hashlib.sha256(cert_path.read_bytes()).hexdigest()
+    except OSError as exc:
         return CertificateVerifyResult(
             ok=False, exit_code=-1, stdout="",
-            stderr="lean binary not found on PATH. Certificate verification skipped.",
+            stderr=f"Failed to read certificate: {exc}",
             duration_ms=0,
         )
-
-    lean_path = str(Path(cohere_lib) / ".lake" / "build" / "lib")
-    env = {**os.environ, "LEAN_PATH": lean_path}
+    cache_key = (digest, lean_bin, lean_path, _build_identity(lean_bin, lean_path))
+    with _verified_cache_lock:
+        hit = _verified_cache.get(cache_key)
+        if hit is not None:
+            _verified_cache.move_to_end(cache_key)
+            return hit
 
     start = time.monotonic()
     try:
@@ -264,13 +365,23 @@ def verify_certificate(cert_path: Path, timeout_seconds: int = 120) -> Certifica
             timeout=timeout_seconds, env=env,
         )
         elapsed = int((time.monotonic() - start) * 1000)
-        return CertificateVerifyResult(
+        result = CertificateVerifyResult(
             ok=proc.returncode == 0,
             exit_code=proc.returncode,
             stdout=proc.stdout,
             stderr=proc.stderr,
             duration_ms=elapsed,
         )
+        if result.ok:
+            with _verified_cache_lock:
+                # Lean's output names this session's snapshot path, so the
+                # shared entry keeps only the verdict.
+                _verified_cache[cache_key] = replace(
+                    result, stdout="", stderr="", duration_ms=0, cached=True,
+                )
+                if len(_verified_cache) > _VERIFIED_CACHE_SIZE:
+                    _verified_cache.popitem(last=False)
+        return result
     except subprocess.TimeoutExpired:
         elapsed = int((time.monotonic() - start) * 1000)
         return CertificateVerifyResult(
@@ -8,12 +8,12 @@ Mirrors the Lean definitions in Cohere.Authoring.ConflictDetection:
 
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 from src.hypergraph.hyperedges import Hyperedge
 
-_VERDICT_RE = re.compile(r"^(Obligated|Allowed|Disallowed|Rejected)\((.+)\)$")
+_VERDICT_KINDS: frozenset[str] = frozenset({"Obligated", "Allowed", "Disallowed", "Rejected"})
 
 _CONFLICTING_KINDS: frozenset[frozenset[str]] = frozenset(
     {
@@ -21,6 +21,10 @@ _CONFLICTING_KINDS: frozenset[frozenset[str]] = frozenset(
         frozenset({"Allowed", "Rejected"}),
     }
 )
+# Both orderings of each pair, so the per-pair check needs no set allocation.
+_CONFLICTING_KIND_PAIRS: frozenset[tuple[str, str]] = frozenset(
+    (a, b) for pair in _CONFLICTING_KINDS for a in pair for b in pair if a != b
+)
 
 
 @dataclass(frozen=True)
@@ -39,15 +43,22 @@ class ConflictWarning:
     resolvable: bool
 
 
+@lru_cache(maxsize=4096)
 def parse_verdict(outcome: str) -> ParsedVerdict | None:
-    match = _VERDICT_RE.match(outcome.strip())
-    if not match:
+    # Hand-rolled equivalent of ^(Obligated|Allowed|Disallowed|Rejected)\((.+)\)$
+    text = outcome.strip()
+    open_paren = text.find("(")
+    if open_paren <= 0 or not text.endswith(")"):
+        return None
+    kind = text[:open_paren]
+    inner = text[open_paren + 1 : -1]
+    if kind not in _VERDICT_KINDS or not inner or "\n" in inner:
         return None
-    return ParsedVerdict(kind=match.group(1), action=match.group(2).strip())
+    return ParsedVerdict(kind=kind, action=inner.strip())
 
 
 def _verdicts_conflict(a: ParsedVerdict, b: ParsedVerdict) -> bool:
-    return a.action == b.action and frozenset({a.kind, b.kind}) in _CONFLICTING_KINDS
+    return a.action == b.action and (a.kind, b.kind) in _CONFLICTING_KIND_PAIRS
 
 
 def _specificity_resolves(r1: Hyperedge, r2: Hyperedge) -> bool:
@@ -61,15 +72,28 @@ def detect_conflicts(rules: tuple[Hyperedge, ...] | list[Hyperedge]) -> list[Con
     Each warning notes whether specificity can resolve the conflict.
     Unresolvable conflicts (independent premises) require author intervention.
     """
-    parsed = [
-        (r, v)
-        for r in rules
-        if (v := parse_verdict(r.expected_outcome)) is not None
-    ]
+    return list(_detect_conflicts_cached(tuple(rules)))
+
+
+@lru_cache(maxsize=128)
+def _detect_conflicts_cached(rules: tuple[Hyperedge, ...]) -> tuple[ConflictWarning, ...]:
+    # Rulesets are immutable tuples of frozen edges, and the same candidate is
+    # checked on every draft read and publish, so the O(n^2) scan is memoized.
+    # Only same-action verdicts can conflict, so pairs are drawn from per-action
+    # groups. Groups keep rule order, so warnings come out in (i, j) order.
+    by_action: dict[str, list[tuple[Hyperedge, ParsedVerdict]]] = {}
+    parsed: list[tuple[Hyperedge, ParsedVerdict, list[tuple[Hyperedge, ParsedVerdict]], int]] = []
+    for r in rules:
+        v = parse_verdict(r.expected_outcome)
+        if v is None:
+            continue
+        group = by_action.setdefault(v.action, [])
+        group.append((r, v))
+        parsed.append((r, v, group, len(group)))
 
     warnings: list[ConflictWarning] = []
-    for i, (r1, v1) in enumerate(parsed):
-        for r2, v2 in parsed[i + 1 :]:
+    for r1, v1, group, start in parsed:
+        for r2, v2 in group[start:]:
             if not _verdicts_conflict(v1, v2):
                 continue
             resolvable = _specificity_resolves(r1, r2)
@@ -83,4 +107,4 @@ def detect_conflicts(rules: tuple[Hyperedge, ...] | list[Hyperedge]) -> list[Con
                     resolvable=resolvable,
                 )
             )
-    return warnings
+    return tuple(warnings)
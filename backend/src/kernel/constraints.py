@@ -0,0 +1,28 @@
+"""Typed records for the kernel's non-rule artifact sections."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class IncompatibilityPair:
+    a: str
+    b: str
+    created_by: str
+    created_at: str
+
+
+@dataclass(frozen=True, slots=True)
+class InfeasibilityEntry:
+    action: str
+    premises: tuple[str, ...]
+    created_by: str
+    created_at: str
+
+
+@dataclass(frozen=True, slots=True)
+class FactExclusionGroup:
+    facts: tuple[str, ...]
+    created_by: str
+    created_at: str
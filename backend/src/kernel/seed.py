@@ -6,12 +6,21 @@ that are loaded into the in-memory store on startup.
 
 from __future__ import annotations
 
+import sys
+
 from src.hypergraph.hyperedges import Hyperedge
+from src.kernel.constraints import FactExclusionGroup, IncompatibilityPair, InfeasibilityEntry
+
+
+def _interned(tokens: set[str]) -> frozenset[str]:
+    # Request facts are interned too, so premise checks hit the identity fast path.
+    return frozenset(map(sys.intern, tokens))
+
 
 SEED_RULES: tuple[Hyperedge, ...] = (
     Hyperedge(
         edge_id="hg_obligate_immediate_delivery_severe_pe_34",
-        premises=frozenset(
+        premises=_interned(
             {
                 "Dx.Preeclampsia",
                 "DxAttr.Preeclampsia.Severe",
@@ -23,7 +32,7 @@ SEED_RULES: tuple[Hyperedge, ...] = (
     ),
     Hyperedge(
         edge_id="hg_obligate_expedited_delivery_placental_abruption",
-        premises=frozenset(
+        premises=_interned(
             {
                 "Dx.PlacentalAbruption",
             }
@@ -33,7 +42,7 @@ SEED_RULES: tuple[Hyperedge, ...] = (
     ),
     Hyperedge(
         edge_id="hg_allow_expedited_delivery_hypertensive_28",
-        premises=frozenset(
+        premises=_interned(
             {
                 "Dx.HypertensiveDisorder",
                 "Ctx.GA_>=28w",
@@ -44,7 +53,7 @@ SEED_RULES: tuple[Hyperedge, ...] = (
     ),
     Hyperedge(
         edge_id="hg_allow_expectant_nonsevere_early_window",
-        premises=frozenset(
+        premises=_interned(
             {
                 "Dx.Preeclampsia",
                 "Ctx.GA_>=28w",
@@ -56,50 +65,50 @@ SEED_RULES: tuple[Hyperedge, ...] = (
     ),
 )
 
-SEED_INCOMPATIBILITY: tuple[dict[str, object], ...] = (
-    {
-        "a": "Action.ImmediateDelivery",
-        "b": "Action.ExpectantManagement",
-        "created_by": "system",
-        "created_at": "seed",
-    },
-    {
-        "a": "Action.ExpeditedDelivery",
-        "b": "Action.ExpectantManagement",
-        "created_by": "system",
-        "created_at": "seed",
-    },
+SEED_INCOMPATIBILITY: tuple[IncompatibilityPair, ...] = (
+    IncompatibilityPair(
+        a="Action.ImmediateDelivery",
+        b="Action.ExpectantManagement",
+        created_by="system",
+        created_at="seed",
+    ),
+    IncompatibilityPair(
+        a="Action.ExpeditedDelivery",
+        b="Action.ExpectantManagement",
+        created_by="system",
+        created_at="seed",
+    ),
 )
 
 # Default: every action is feasible. This table encodes exceptions.
 # Each entry fires when its premises are a subset of the patient's fact set.
-SEED_INFEASIBILITY: tuple[dict[str, object], ...] = (
-    {
-        "action": "Action.ExpectantManagement",
-        "premises": ["Dx.FetalDemise"],
-        "created_by": "system",
-        "created_at": "seed",
-    },
-    {
-        "action": "Action.ExpectantManagement",
-        "premises": ["DxAttr.Preeclampsia.Severe"],
-        "created_by": "system",
-        "created_at": "seed",
-    },
-    {
-        "action": "Action.ImmediateDelivery",
-        "premises": ["Ctx.GA_<34w"],
-        "created_by": "system",
-        "created_at": "seed",
-    },
+SEED_INFEASIBILITY: tuple[InfeasibilityEntry, ...] = (
+    InfeasibilityEntry(
+        action="Action.ExpectantManagement",
+        premises=("Dx.FetalDemise",),
+        created_by="system",
+        created_at="seed",
+    ),
+    InfeasibilityEntry(
+        action="Action.ExpectantManagement",
+        premises=("DxAttr.Preeclampsia.Severe",),
+        created_by="system",
+        created_at="seed",
+    ),
+    InfeasibilityEntry(
+        action="Action.ImmediateDelivery",
+        premises=("Ctx.GA_<34w",),
+        created_by="system",
+        created_at="seed",
+    ),
 )
 
-SEED_FACT_EXCLUSIONS: tuple[dict[str, object], ...] = (
-    {
-        "facts": ["Ctx.GA_<34w", "Ctx.GA_>=34w"],
-        "created_by": "system",
-        "created_at": "seed",
-    },
+SEED_FACT_EXCLUSIONS: tuple[FactExclusionGroup, ...] = (
+    FactExclusionGroup(
+        facts=("Ctx.GA_<34w", "Ctx.GA_>=34w"),
+        created_by="system",
+        created_at="seed",
+    ),
 )
 
 SEED_MANIFEST_DEFAULTS = {
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import sys
 import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import cached_property
 from threading import Lock
 
 from src.hypergraph.hyperedges import Hyperedge
+from src.kernel.constraints import FactExclusionGroup, IncompatibilityPair, InfeasibilityEntry
 from src.kernel.seed import (
     SEED_FACT_EXCLUSIONS,
     SEED_INCOMPATIBILITY,
@@ -32,6 +35,15 @@ class RuleProvenance:
     created_by: str
     created_at: datetime
 
+    @cached_property
+    def created_at_iso(self) -> str:
+        return self.created_at.isoformat()
+
+    @cached_property
+    def source_label(self) -> str:
+        """``by=<author> | at=<iso timestamp>``, as written into snapshot rule sources."""
+        return f"by={self.created_by} | at={self.created_at_iso}"
+
 
 @dataclass(frozen=True)
 class KernelArtifactBundle:
@@ -40,9 +52,9 @@ class KernelArtifactBundle:
     manifest: KernelArtifactManifest
     ruleset: tuple[Hyperedge, ...]
     rule_provenance: dict[str, RuleProvenance]
-    incompatibility: tuple[dict[str, object], ...]
-    infeasibility: tuple[dict[str, object], ...]
-    fact_exclusions: tuple[dict[str, object], ...]
+    incompatibility: tuple[IncompatibilityPair, ...]
+    infeasibility: tuple[InfeasibilityEntry, ...]
+    fact_exclusions: tuple[FactExclusionGroup, ...]
     proof_report: dict[str, object]
 
 
@@ -56,14 +68,18 @@ class KernelVerificationStatus:
 
 @dataclass(frozen=True)
 class KernelDraftProposals:
-    """Pending changes to be merged into the verified runtime ruleset."""
+    """Pending changes to be merged into the verified runtime ruleset.
+
+    ``rule_provenance`` has exactly one entry per proposal, so it doubles as
+    the draft's rule-id index.
+    """
 
     manifest: KernelArtifactManifest
     proposals: tuple[Hyperedge, ...]
     rule_provenance: dict[str, RuleProvenance]
-    incompatibility: tuple[dict[str, object], ...]
-    infeasibility: tuple[dict[str, object], ...]
-    fact_exclusions: tuple[dict[str, object], ...]
+    incompatibility: tuple[IncompatibilityPair, ...]
+    infeasibility: tuple[InfeasibilityEntry, ...]
+    fact_exclusions: tuple[FactExclusionGroup, ...]
 
 
 class InMemoryKernelArtifactStore:
@@ -101,6 +117,8 @@ class InMemoryKernelArtifactStore:
         )
         self._runtime_bundle: KernelArtifactBundle | None = None
         self._runtime_verification = KernelVerificationStatus(status="unverified")
+        # Candidate merge is rebuilt only when the draft or runtime object changes.
+        self._candidate_cache: tuple[KernelDraftProposals, KernelArtifactBundle | None, KernelArtifactBundle] | None = None
 
     @property
     def last_accessed(self) -> float:
@@ -129,6 +147,18 @@ class InMemoryKernelArtifactStore:
             self.touch()
             return self._runtime_bundle.ruleset if self._runtime_bundle is not None else tuple()
 
+    def get_runtime_state(self) -> tuple[KernelArtifactBundle | None, KernelVerificationStatus]:
+        """Return the runtime bundle and its verification status from one lock acquisition."""
+        with self._lock:
+            self.touch()
+            return self._runtime_bundle, self._runtime_verification
+
+    def get_draft_and_candidate(self) -> tuple[KernelDraftProposals, KernelArtifactBundle]:
+        """Return the draft and the candidate merged from it under a single lock."""
+        with self._lock:
+            self.touch()
+            return self._draft, self._candidate_unlocked()
+
     def replace_draft_proposals(
         self,
         *,
@@ -140,7 +170,7 @@ class InMemoryKernelArtifactStore:
         with self._lock:
             self.touch()
             now = datetime.now(timezone.utc)
-            previous_provenance = dict(self._draft.rule_provenance)
+            previous_provenance = self._draft.rule_provenance
             next_provenance: dict[str, RuleProvenance] = {}
             for edge in rules:
                 existing = previous_provenance.get(edge.edge_id)
@@ -171,22 +201,39 @@ class InMemoryKernelArtifactStore:
     def build_candidate_runtime_bundle(self) -> KernelArtifactBundle:
         with self._lock:
             self.touch()
-            return self._build_candidate_unlocked()
+            return self._candidate_unlocked()
 
-    def _build_candidate_unlocked(self) -> KernelArtifactBundle:
-        """Merge verified runtime rules with draft proposals (draft overrides by ruleId)."""
+    def _candidate_unlocked(self) -> KernelArtifactBundle:
+        """Return the cached candidate, rebuilding it if draft or runtime was replaced."""
 
-        runtime = self._runtime_bundle
-        base_rules = list(runtime.ruleset) if runtime is not None else []
-        base_prov = dict(runtime.rule_provenance) if runtime is not None else {}
+        cached = self._candidate_cache
+        if cached is not None and cached[0] is self._draft and cached[1] is self._runtime_bundle:
+            return cached[2]
+        candidate = self._build_candidate_unlocked()
+        self._candidate_cache = (self._draft, self._runtime_bundle, candidate)
+        return candidate
 
-        proposal_map = {edge.edge_id: edge for edge in self._draft.proposals}
-        merged_map = {edge.edge_id: edge for edge in base_rules}
-        merged_map.update(proposal_map)
+    def _build_candidate_unlocked(self) -> KernelArtifactBundle:
+        """Merge verified runtime rules with draft proposals (draft overrides by ruleId).
+
+        The merged ruleset is ordered by edge_id; callers rely on that ordering.
+        """
 
-        merged_rules = [merged_map[key] for key in sorted(merged_map)]
-        merged_prov = base_prov
-        merged_prov.update(self._draft.rule_provenance)
+        runtime = self._runtime_bundle
+        proposals = self._draft.proposals
+
+        if runtime is not None and not proposals:
+            # Nothing to merge: the runtime ruleset is already edge_id-ordered.
+            merged_rules = runtime.ruleset
+            merged_prov = runtime.rule_provenance
+        else:
+            merged_map = {edge.edge_id: edge for edge in runtime.ruleset} if runtime is not None else {}
+            merged_map.update((edge.edge_id, edge) for edge in proposals)
+            merged_rules = tuple(merged_map[key] for key in sorted(merged_map))
+            if runtime is not None:
+                merged_prov = {**runtime.rule_provenance, **self._draft.rule_provenance}
+            else:
+                merged_prov = dict(self._draft.rule_provenance)
 
         incompatibility = self._draft.incompatibility or (
             runtime.incompatibility if runtime is not None else ()
@@ -200,7 +247,7 @@ class InMemoryKernelArtifactStore:
 
         return KernelArtifactBundle(
             manifest=self._draft.manifest,
-            ruleset=tuple(merged_rules),
+            ruleset=merged_rules,
             rule_provenance=merged_prov,
             incompatibility=incompatibility,
             infeasibility=infeasibility,
@@ -217,15 +264,15 @@ class InMemoryKernelArtifactStore:
         with self._lock:
             self.touch()
             for existing in self._draft.incompatibility:
-                ea, eb = existing["a"], existing["b"]
+                ea, eb = existing.a, existing.b
                 if (ea == a and eb == b) or (ea == b and eb == a):
                     raise ValueError(f"Incompatibility pair already exists: ({a}, {b})")
             now = datetime.now(timezone.utc)
-            entry: dict[str, object] = {
-                "a": a, "b": b,
-                "created_by": created_by, "created_at": now.isoformat(),
-            }
+            entry = IncompatibilityPair(
+                a=sys.intern(a), b=sys.intern(b), created_by=created_by, created_at=now.isoformat(),
+            )
             self._draft = self._mutated_draft(
+                now=now,
                 updated_by=created_by,
                 change_summary=f"Added incompatibility pair: ({a}, {b})",
                 incompatibility=self._draft.incompatibility + (entry,),
@@ -240,13 +287,13 @@ class InMemoryKernelArtifactStore:
             pairs = list(self._draft.incompatibility)
             if index < 0 or index >= len(pairs):
                 raise IndexError(f"Incompatibility pair index {index} out of range (0..{len(pairs) - 1}).")
+            now = datetime.now(timezone.utc)
             old = pairs[index]
-            pairs[index] = {
-                "a": a, "b": b,
-                "created_by": old.get("created_by", updated_by),
-                "created_at": old.get("created_at", datetime.now(timezone.utc).isoformat()),
-            }
+            pairs[index] = IncompatibilityPair(
+                a=sys.intern(a), b=sys.intern(b), created_by=old.created_by, created_at=old.created_at,
+            )
             self._draft = self._mutated_draft(
+                now=now,
                 updated_by=updated_by,
                 change_summary=f"Updated incompatibility pair at index {index}: ({a}, {b})",
                 incompatibility=tuple(pairs),
@@ -261,8 +308,9 @@ class InMemoryKernelArtifactStore:
                 raise IndexError(f"Incompatibility pair index {index} out of range (0..{len(pairs) - 1}).")
             removed = pairs.pop(index)
             self._draft = self._mutated_draft(
+                now=datetime.now(timezone.utc),
                 updated_by=updated_by,
-                change_summary=f"Removed incompatibility pair: ({removed.get('a', '?')}, {removed.get('b', '?')})",
+                change_summary=f"Removed incompatibility pair: ({removed.a}, {removed.b})",
                 incompatibility=tuple(pairs),
             )
             return self._draft
@@ -275,11 +323,12 @@ class InMemoryKernelArtifactStore:
         with self._lock:
             self.touch()
             now = datetime.now(timezone.utc)
-            entry: dict[str, object] = {
-                "action": action, "premises": premises,
-                "created_by": created_by, "created_at": now.isoformat(),
-            }
+            entry = InfeasibilityEntry(
+                action=sys.intern(action), premises=tuple(map(sys.intern, premises)),
+                created_by=created_by, created_at=now.isoformat(),
+            )
             self._draft = self._mutated_draft(
+                now=now,
                 updated_by=created_by,
                 change_summary=f"Added infeasibility entry: {action} with premises {premises}",
                 infeasibility=self._draft.infeasibility + (entry,),
@@ -294,13 +343,14 @@ class InMemoryKernelArtifactStore:
             entries = list(self._draft.infeasibility)
             if index < 0 or index >= len(entries):
                 raise IndexError(f"Infeasibility entry index {index} out of range (0..{len(entries) - 1}).")
+            now = datetime.now(timezone.utc)
             old = entries[index]
-            entries[index] = {
-                "action": action, "premises": premises,
-                "created_by": old.get("created_by", updated_by),
-                "created_at": old.get("created_at", datetime.now(timezone.utc).isoformat()),
-            }
+            entries[index] = InfeasibilityEntry(
+                action=sys.intern(action), premises=tuple(map(sys.intern, premises)),
+                created_by=old.created_by, created_at=old.created_at,
+            )
             self._draft = self._mutated_draft(
+                now=now,
                 updated_by=updated_by,
                 change_summary=f"Updated infeasibility entry at index {index}: {action}",
                 infeasibility=tuple(entries),
@@ -315,8 +365,9 @@ class InMemoryKernelArtifactStore:
                 raise IndexError(f"Infeasibility entry index {index} out of range (0..{len(entries) - 1}).")
             removed = entries.pop(index)
             self._draft = self._mutated_draft(
+                now=datetime.now(timezone.utc),
                 updated_by=updated_by,
-                change_summary=f"Removed infeasibility entry for action: {removed.get('action', '?')}",
+                change_summary=f"Removed infeasibility entry for action: {removed.action}",
                 infeasibility=tuple(entries),
             )
             return self._draft
@@ -330,15 +381,14 @@ class InMemoryKernelArtifactStore:
             self.touch()
             fact_set = frozenset(facts)
             for existing in self._draft.fact_exclusions:
-                if frozenset(existing.get("facts", [])) == fact_set:
+                if frozenset(existing.facts) == fact_set:
                     raise ValueError(f"Fact exclusion group already exists: {facts}")
             now = datetime.now(timezone.utc)
-            entry: dict[str, object] = {
-                "facts": facts,
-                "created_by": created_by,
-                "created_at": now.isoformat(),
-            }
+            entry = FactExclusionGroup(
+                facts=tuple(map(sys.intern, facts)), created_by=created_by, created_at=now.isoformat(),
+            )
             self._draft = self._mutated_draft(
+                now=now,
                 updated_by=created_by,
                 change_summary=f"Added fact exclusion group: {facts}",
                 fact_exclusions=self._draft.fact_exclusions + (entry,),
@@ -353,8 +403,9 @@ class InMemoryKernelArtifactStore:
                 raise IndexError(f"Fact exclusion index {index} out of range (0..{len(groups) - 1}).")
             removed = groups.pop(index)
             self._draft = self._mutated_draft(
+                now=datetime.now(timezone.utc),
                 updated_by=updated_by,
-                change_summary=f"Removed fact exclusion group: {removed.get('facts', '?')}",
+                change_summary=f"Removed fact exclusion group: {list(removed.facts)}",
                 fact_exclusions=tuple(groups),
             )
             return self._draft
@@ -366,14 +417,14 @@ class InMemoryKernelArtifactStore:
     ) -> KernelDraftProposals:
         with self._lock:
             self.touch()
-            for existing in self._draft.proposals:
-                if existing.edge_id == edge.edge_id:
-                    raise ValueError(f"Rule with id '{edge.edge_id}' already exists in draft.")
+            if edge.edge_id in self._draft.rule_provenance:
+                raise ValueError(f"Rule with id '{edge.edge_id}' already exists in draft.")
 
             now = datetime.now(timezone.utc)
             provenance = dict(self._draft.rule_provenance)
             provenance[edge.edge_id] = RuleProvenance(created_by=created_by, created_at=now)
             self._draft = self._mutated_draft(
+                now=now,
                 updated_by=created_by,
                 change_summary=f"Added rule: {edge.edge_id}",
                 proposals=self._draft.proposals + (edge,),
@@ -386,24 +437,25 @@ class InMemoryKernelArtifactStore:
     ) -> KernelDraftProposals:
         with self._lock:
             self.touch()
-            proposals = list(self._draft.proposals)
-            found = False
-            for i, existing in enumerate(proposals):
-                if existing.edge_id == rule_id:
-                    proposals[i] = edge
-                    found = True
-                    break
-            if not found:
+            if rule_id not in self._draft.rule_provenance:
                 raise KeyError(f"Rule with id '{rule_id}' not found in draft.")
+            proposals = tuple(
+                edge if existing.edge_id == rule_id else existing
+                for existing in self._draft.proposals
+            )
 
-            provenance = dict(self._draft.rule_provenance)
-            old = provenance.pop(rule_id, None)
-            provenance[edge.edge_id] = old or RuleProvenance(created_by=updated_by, created_at=datetime.now(timezone.utc))
+            now = datetime.now(timezone.utc)
+            # Provenance is keyed by rule id, so an in-place edit keeps the map as is.
+            provenance: dict[str, RuleProvenance] | None = None
+            if edge.edge_id != rule_id:
+                provenance = dict(self._draft.rule_provenance)
+                provenance[edge.edge_id] = provenance.pop(rule_id)
 
             self._draft = self._mutated_draft(
+                now=now,
                 updated_by=updated_by,
                 change_summary=f"Updated rule: {rule_id}",
-                proposals=tuple(proposals),
+                proposals=proposals,
                 rule_provenance=provenance,
             )
             return self._draft
@@ -411,12 +463,13 @@ class InMemoryKernelArtifactStore:
     def remove_rule(self, *, rule_id: str, updated_by: str) -> KernelDraftProposals:
         with self._lock:
             self.touch()
-            proposals = [e for e in self._draft.proposals if e.edge_id != rule_id]
-            if len(proposals) == len(self._draft.proposals):
+            if rule_id not in self._draft.rule_provenance:
                 raise KeyError(f"Rule with id '{rule_id}' not found in draft.")
+            proposals = [e for e in self._draft.proposals if e.edge_id != rule_id]
             provenance = dict(self._draft.rule_provenance)
             provenance.pop(rule_id, None)
             self._draft = self._mutated_draft(
+                now=datetime.now(timezone.utc),
                 updated_by=updated_by,
                 change_summary=f"Removed rule: {rule_id}",
                 proposals=tuple(proposals),
@@ -429,16 +482,16 @@ class InMemoryKernelArtifactStore:
     def _mutated_draft(
         self,
         *,
+        now: datetime,
         updated_by: str,
         change_summary: str,
         proposals: tuple[Hyperedge, ...] | None = None,
         rule_provenance: dict[str, RuleProvenance] | None = None,
-        incompatibility: tuple[dict[str, object], ...] | None = None,
-        infeasibility: tuple[dict[str, object], ...] | None = None,
-        fact_exclusions: tuple[dict[str, object], ...] | None = None,
+        incompatibility: tuple[IncompatibilityPair, ...] | None = None,
+        infeasibility: tuple[InfeasibilityEntry, ...] | None = None,
+        fact_exclusions: tuple[FactExclusionGroup, ...] | None = None,
     ) -> KernelDraftProposals:
         """Return a new draft with bumped revision. Must be called under self._lock."""
-        now = datetime.now(timezone.utc)
         manifest = KernelArtifactManifest(
             artifact_source=self._draft.manifest.artifact_source,
             ruleset_version=self._draft.manifest.ruleset_version,
@@ -466,7 +519,7 @@ class InMemoryKernelArtifactStore:
         with self._lock:
             self.touch()
             now = verified_at or datetime.now(timezone.utc)
-            candidate = self._build_candidate_unlocked()
+            candidate = self._candidate_unlocked()
             self._runtime_bundle = candidate
             self._runtime_verification = KernelVerificationStatus(
                 status="verified",
@@ -504,11 +557,13 @@ class SessionManager:
     """
 
     DEFAULT_TTL_SECONDS = 7200.0  # 2 hours
+    CLEANUP_INTERVAL_SECONDS = 60.0
 
     def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS) -> None:
         self._sessions: dict[str, InMemoryKernelArtifactStore] = {}
         self._lock = Lock()
         self._ttl = ttl_seconds
+        self._last_cleanup = time.monotonic()
 
     @property
     def active_session_count(self) -> int:
@@ -518,14 +573,20 @@ class SessionManager:
     def get_or_create(self, session_id: str) -> InMemoryKernelArtifactStore:
         with self._lock:
             self._cleanup_expired()
-            if session_id in self._sessions:
-                self._sessions[session_id].touch()
+            store = self._sessions.get(session_id)
+            # The sweep is throttled, so check this session's own expiry too.
+            if store is None or time.monotonic() - store.last_accessed > self._ttl:
+                store = self._sessions[session_id] = InMemoryKernelArtifactStore()
             else:
-                self._sessions[session_id] = InMemoryKernelArtifactStore()
-            return self._sessions[session_id]
+                store.touch()
+            return store
 
     def _cleanup_expired(self) -> None:
+        # Sweeping is O(sessions); once a minute is plenty for a 2 hour TTL.
         now = time.monotonic()
+        if now - self._last_cleanup < self.CLEANUP_INTERVAL_SECONDS:
+            return
+        self._last_cleanup = now
         expired = [
             sid for sid, store in self._sessions.items()
             if now - store.last_accessed > self._ttl
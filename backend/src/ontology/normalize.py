@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 
 
@@ -219,7 +220,7 @@ def _discretize_gestational_age(weeks: float) -> list[str]:
     if not satisfied:
         return []
     highest = max(satisfied)
-    return [f"Ctx.GA_>={highest}w"]
+    return [sys.intern(f"Ctx.GA_>={highest}w")]
 
 
 def _discretize_maternal_age(years: float) -> list[str]:
@@ -227,9 +228,9 @@ def _discretize_maternal_age(years: float) -> list[str]:
         raise ValueError("Maternal age must be between 15 and 55 years.")
     satisfied = [threshold for threshold in MATERNAL_AGE_THRESHOLDS if years >= threshold]
     if not satisfied:
-        return [f"Ctx.MaternalAge_<{MATERNAL_AGE_THRESHOLDS[0]}y"]
+        return [sys.intern(f"Ctx.MaternalAge_<{MATERNAL_AGE_THRESHOLDS[0]}y")]
     highest = max(satisfied)
-    return [f"Ctx.MaternalAge_>={highest}y"]
+    return [sys.intern(f"Ctx.MaternalAge_>={highest}y")]
 
 
 def _discretize_bmi(bmi: float) -> list[str]:
@@ -237,9 +238,9 @@ def _discretize_bmi(bmi: float) -> list[str]:
         raise ValueError("BMI must be between 15 and 60.")
     satisfied = [threshold for threshold in BMI_THRESHOLDS if bmi >= threshold]
     if not satisfied:
-        return [f"Ctx.BMI_<{BMI_THRESHOLDS[0]}"]
+        return [sys.intern(f"Ctx.BMI_<{BMI_THRESHOLDS[0]}")]
     highest = max(satisfied)
-    return [f"Ctx.BMI_>={highest}"]
+    return [sys.intern(f"Ctx.BMI_>={highest}")]
 
 
 def normalize_ontology_input(payload: OntologyInput) -> OntologyResult:
@@ -275,14 +276,12 @@ def normalize_ontology_input(payload: OntologyInput) -> OntologyResult:
                 "Unknown diagnosis attribute IDs for "
                 f"{diagnosis.label}: {', '.join(sorted(unknown_attribute_ids))}"
             )
-        diagnosis_attribute_tokens = [
-            diagnosis.diagnosis_attribute_by_id[attribute_id][0]
-            for attribute_id in selected_attribute_ids
-        ]
-        diagnosis_attribute_labels = [
-            diagnosis.diagnosis_attribute_by_id[attribute_id][1]
-            for attribute_id in selected_attribute_ids
-        ]
+        diagnosis_attribute_tokens: list[str] = []
+        diagnosis_attribute_labels: list[str] = []
+        for attribute_id in selected_attribute_ids:
+            attribute_token, attribute_label = diagnosis.diagnosis_attribute_by_id[attribute_id]
+            diagnosis_attribute_tokens.append(attribute_token)
+            diagnosis_attribute_labels.append(attribute_label)
         diagnosis_attribute_fact_set.update(diagnosis_attribute_tokens)
         expanded_tokens = mapped_tokens + diagnosis_attribute_tokens
         if diagnosis_attribute_tokens:
@@ -397,16 +396,15 @@ def normalize_ontology_input(payload: OntologyInput) -> OntologyResult:
             )
         )
 
-    context_facts = sorted(
-        set(
-            comorbidity_facts
-            + physiologic_facts
-            + ga_facts
-            + maternal_age_facts
-            + bmi_facts
-        )
-    )
-    combined_facts = sorted(set(diagnosis_facts + diagnosis_attribute_facts + context_facts))
+    context_fact_set = {
+        *comorbidity_facts,
+        *physiologic_facts,
+        *ga_facts,
+        *maternal_age_facts,
+        *bmi_facts,
+    }
+    context_facts = sorted(context_fact_set)
+    combined_facts = sorted(diagnosis_fact_set | diagnosis_attribute_fact_set | context_fact_set)
 
     return OntologyResult(
         facts=combined_facts,
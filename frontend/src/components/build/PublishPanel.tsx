@@ -564,8 +564,11 @@ function CertificateCard({
         {verified ? (
           <p className="text-sm font-medium text-violet-700">
             Lean&apos;s kernel successfully compiled and verified all three
-            theorems ({verifyResult.durationMs}ms). The invariants are proven
-            to hold universally.
+            theorems (
+            {verifyResult.cached
+              ? "reused an earlier compile of this identical certificate"
+              : `${verifyResult.durationMs}ms`}
+            ). The invariants are proven to hold universally.
           </p>
         ) : skipped ? (
           <p className="text-sm text-slate-500">
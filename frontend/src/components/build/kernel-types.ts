@@ -94,6 +94,7 @@ export type CertificateVerifyResult = {
   stdout: string;
   stderr: string;
   durationMs: number;
+  cached?: boolean;
 };
 
 export type KernelPublishSnapshotResponse = {